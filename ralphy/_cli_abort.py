@@ -0,0 +1,45 @@
+"""The `ralphy abort` command."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from ralphy.claude import abort_running_claude
+from ralphy.constants import FEATURE_NAME_PATTERN
+from ralphy.logger import get_logger
+from ralphy.state import AWAITING_VALIDATION_PHASES, RUNNING_PHASES, StateManager
+
+
+@click.command("abort")
+@click.argument("feature_name", type=str)
+def cmd(feature_name: str):
+    """Abort le workflow en cours.
+
+    FEATURE_NAME: Nom de la feature
+    """
+    project = Path.cwd()
+    logger = get_logger()
+
+    # Validate feature name
+    if not FEATURE_NAME_PATTERN.match(feature_name):
+        logger.error(f"Invalid feature name: {feature_name}")
+        sys.exit(1)
+
+    state_manager = StateManager(project, feature_name)
+
+    # Lit l'état une seule fois pour toutes les vérifications
+    phase = state_manager.state.phase
+    running = phase in RUNNING_PHASES
+
+    # Vérifie si le workflow est actif (running ou en attente de validation)
+    if not running and phase not in AWAITING_VALIDATION_PHASES:
+        logger.warn("Aucun workflow en cours")
+        return
+
+    # Interrompt le process Claude s'il est en cours (pas de process pendant validation)
+    if running:
+        abort_running_claude(project)
+
+    state_manager.set_failed("Avorté par l'utilisateur")
+    logger.info("Workflow avorté")
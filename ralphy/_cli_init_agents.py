@@ -0,0 +1,94 @@
+"""The `ralphy init-agents` command."""
+
+from importlib import resources
+from importlib.resources.abc import Traversable
+from pathlib import Path
+
+import click
+
+from ralphy.cli import get_console
+from ralphy.logger import get_logger
+from ralphy.templates import AGENT_FILES
+
+
+def _copy_agent(templates: Traversable, agent_file: str, agents_dir: Path, force: bool) -> str:
+    """Copies one agent template into agents_dir.
+
+    Returns:
+        "copied", "skipped" (file exists and not force) or "missing"
+        (template not found in package).
+    """
+    dest_path = agents_dir / agent_file
+
+    # Skip if file exists and --force not specified
+    if dest_path.exists() and not force:
+        return "skipped"
+
+    # Load raw UTF-8 bytes from package (copied verbatim, no decode/encode)
+    try:
+        content = templates.joinpath(agent_file).read_bytes()
+    except (FileNotFoundError, TypeError):
+        return "missing"
+
+    # Write to a temp file then rename (atomic on POSIX filesystems), so a
+    # crash never leaves a half-written agent behind. Agents include their
+    # own documentation in frontmatter.
+    temp_path = dest_path.with_name(dest_path.name + ".tmp")
+    try:
+        temp_path.write_bytes(content)
+        temp_path.replace(dest_path)
+    except Exception:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return "copied"
+
+
+@click.command("init-agents")
+@click.argument("project_path", type=click.Path(exists=True, file_okay=False, resolve_path=True), required=False)
+@click.option("--force", is_flag=True, help="Overwrite existing agent files")
+def cmd(project_path: str = None, force: bool = False):
+    """Initialize custom agent templates.
+
+    Copies default agent templates to .claude/agents/ in the project.
+    These templates can be modified to adapt Ralphy to your tech stack.
+
+    PROJECT_PATH: Path to the project (default: current directory)
+
+    Use --force to overwrite existing agent files.
+    """
+    project = Path(project_path) if project_path else Path.cwd()
+    logger = get_logger()
+    console = get_console()
+
+    # Create .claude/agents/ directory if it doesn't exist
+    agents_dir = project / ".claude" / "agents"
+    agents_dir.mkdir(parents=True, exist_ok=True)
+
+    # Resolve the package anchor once for all templates
+    templates = resources.files("ralphy.templates.agents")
+
+    copied = 0
+    skipped = 0
+
+    for agent_file in AGENT_FILES:
+        result = _copy_agent(templates, agent_file, agents_dir, force)
+        if result == "skipped":
+            logger.warn(f"Skipping {agent_file} (exists, use --force to overwrite)")
+            skipped += 1
+        elif result == "missing":
+            logger.error(f"Template {agent_file} not found in package")
+        else:
+            logger.info(f"Created {agent_file}")
+            copied += 1
+
+    # Summary
+    console.print()
+    if copied > 0:
+        console.print(f"[green]✓[/green] {copied} agent(s) copied to {agents_dir}")
+    if skipped > 0:
+        console.print(f"[yellow]![/yellow] {skipped} agent(s) skipped (use --force to overwrite)")
+
+    if copied > 0:
+        console.print()
+        console.print("[dim]Edit these files to customize Ralphy for your project.[/dim]")
+        console.print("[dim]Remember: agents must contain EXIT_SIGNAL instruction.[/dim]")
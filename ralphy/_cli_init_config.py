@@ -0,0 +1,52 @@
+"""The `ralphy init-config` command."""
+
+from pathlib import Path
+
+import click
+
+from ralphy.cli import get_console
+from ralphy.logger import get_logger
+from ralphy.templates import generate_config_template
+
+
+@click.command("init-config")
+@click.argument("project_path", type=click.Path(exists=True, file_okay=False, resolve_path=True), required=False)
+@click.option("--force", is_flag=True, help="Overwrite existing config file")
+def cmd(project_path: str = None, force: bool = False):
+    """Initialize a default configuration file.
+
+    Creates a .ralphy/config.yaml file with all default values and documentation
+    comments. This file can be customized to adjust timeouts, models, and other
+    settings for your project.
+
+    PROJECT_PATH: Path to the project (default: current directory)
+
+    Use --force to overwrite an existing config file.
+    """
+    project = Path(project_path) if project_path else Path.cwd()
+    logger = get_logger()
+    console = get_console()
+
+    # Create .ralphy/ directory if it doesn't exist
+    ralphy_dir = project / ".ralphy"
+    ralphy_dir.mkdir(parents=True, exist_ok=True)
+
+    config_path = ralphy_dir / "config.yaml"
+
+    # Check if config already exists
+    if config_path.exists() and not force:
+        logger.warn(f"Config file already exists: {config_path}")
+        console.print("[dim]Use --force to overwrite.[/dim]")
+        return
+
+    # Generate and write config template
+    template = generate_config_template()
+    config_path.write_text(template, encoding="utf-8")
+
+    if config_path.exists():
+        console.print(f"[green]✓[/green] Created {config_path}")
+        console.print()
+        console.print("[dim]Edit this file to customize Ralphy for your project.[/dim]")
+        console.print("[dim]Only override values you need to change.[/dim]")
+    else:
+        logger.error(f"Failed to create config file: {config_path}")
@@ -0,0 +1,32 @@
+"""The `ralphy reset` command."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from ralphy.constants import FEATURE_NAME_PATTERN
+from ralphy.logger import get_logger
+from ralphy.state import StateManager
+
+
+@click.command("reset")
+@click.argument("feature_name", type=str)
+def cmd(feature_name: str):
+    """Réinitialise l'état du workflow.
+
+    FEATURE_NAME: Nom de la feature
+    """
+    project = Path.cwd()
+    logger = get_logger()
+
+    # Validate feature name
+    if not FEATURE_NAME_PATTERN.match(feature_name):
+        logger.error(f"Invalid feature name: {feature_name}")
+        sys.exit(1)
+
+    state_manager = StateManager(project, feature_name)
+
+    if click.confirm(f"Réinitialiser l'état du workflow pour {feature_name} ?", default=False):
+        state_manager.reset()
+        logger.info("État réinitialisé")
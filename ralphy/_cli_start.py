@@ -0,0 +1,132 @@
+"""The `ralphy start` command."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from ralphy.claude import (
+    check_claude_installed,
+    check_gh_installed,
+    check_git_installed,
+)
+from ralphy.cli import description_to_feature_name
+from ralphy.config import get_feature_dir
+from ralphy.constants import FEATURE_NAME_PATTERN
+from ralphy.logger import get_logger
+from ralphy.orchestrator import Orchestrator
+from ralphy.state import RUNNING_PHASES, StateManager
+from ralphy.templates import generate_quick_prd
+
+
+def _check_dependencies() -> list[tuple[str, str]]:
+    """Check for required dependencies.
+
+    Returns:
+        List of (name, install_hint) tuples for missing dependencies.
+    """
+    missing = []
+    if not check_claude_installed():
+        missing.append(("Claude Code CLI", "npm install -g @anthropic-ai/claude-code"))
+    if not check_git_installed():
+        missing.append(("Git", "https://git-scm.com/"))
+    if not check_gh_installed():
+        missing.append(("GitHub CLI (gh)", "https://cli.github.com/"))
+    return missing
+
+
+@click.command("start")
+@click.argument("feature_or_description", type=str)
+@click.option("--no-progress", is_flag=True, help="Disable progress display")
+@click.option("--fresh", is_flag=True, help="Force a full restart without resume")
+def cmd(feature_or_description: str, no_progress: bool, fresh: bool):
+    """Starts a Ralphy workflow for a feature.
+
+    FEATURE_OR_DESCRIPTION: Either a feature name (ex: user-authentication) or a
+    feature description in quotes (ex: "implement auth with devise")
+
+    Normal mode (feature name):
+        The PRD.md must exist in docs/features/<feature-name>/PRD.md
+
+    Quick start mode (description):
+        If the input doesn't match an existing feature with PRD.md, Ralphy will:
+        - Derive a feature name from the description
+        - Create the feature directory
+        - Generate a minimal PRD.md
+        - Run the full workflow
+
+    By default, if the workflow was interrupted, it will resume from the
+    last completed phase. Use --fresh to force a complete restart.
+    """
+    project = Path.cwd()
+    logger = get_logger()
+    show_progress = not no_progress
+
+    # Check required dependencies
+    missing_deps = _check_dependencies()
+    if missing_deps:
+        for name, hint in missing_deps:
+            logger.error(f"{name} not found. Install it: {hint}")
+        sys.exit(1)
+
+    # Determine if this is quick start mode or normal mode
+    is_quick_start = False
+    feature_name = feature_or_description
+
+    if FEATURE_NAME_PATTERN.match(feature_or_description):
+        # Looks like a valid feature name - check if PRD exists
+        feature_dir = get_feature_dir(project, feature_or_description)
+        if not (feature_dir / "PRD.md").exists():
+            # No PRD exists, treat as quick start
+            is_quick_start = True
+    else:
+        # Not a valid feature name pattern, treat as description (quick start)
+        is_quick_start = True
+
+    if is_quick_start:
+        # Quick start mode: derive feature name from description
+        try:
+            feature_name = description_to_feature_name(feature_or_description)
+        except ValueError as e:
+            logger.error(str(e))
+            sys.exit(1)
+
+        feature_dir = get_feature_dir(project, feature_name)
+        prd_path = feature_dir / "PRD.md"
+
+        # Check if the derived feature name conflicts with an existing feature
+        if prd_path.exists():
+            logger.warn(f"Feature '{feature_name}' already exists with a PRD.md")
+            logger.info("Using existing PRD.md instead of generating a new one")
+        else:
+            # Create feature directory and generate PRD
+            feature_dir.mkdir(parents=True, exist_ok=True)
+            prd_content = generate_quick_prd(feature_or_description)
+            prd_path.write_text(prd_content, encoding="utf-8")
+            logger.info(f"Quick start: created {prd_path}")
+    else:
+        # Normal mode: feature name with existing PRD
+        feature_dir = get_feature_dir(project, feature_name)
+        prd_path = feature_dir / "PRD.md"
+        if not prd_path.exists():
+            logger.error(f"PRD.md not found in {feature_dir}")
+            logger.error(f"Create {prd_path} with your feature requirements")
+            sys.exit(1)
+
+    # Vérifie si un workflow est déjà en cours
+    state_manager = StateManager(project, feature_name)
+    phase = state_manager.state.phase
+    if phase in RUNNING_PHASES:
+        logger.warn(f"Un workflow est déjà en cours (phase: {phase.value})")
+        if not click.confirm("Voulez-vous le réinitialiser ?", default=False):
+            sys.exit(0)
+        state_manager.reset()
+
+    # Lance l'orchestrateur
+    logger.info(f"Démarrage du workflow pour: {feature_name}")
+    logger.newline()
+
+    orchestrator = Orchestrator(project, feature_name=feature_name, show_progress=show_progress)
+    success = orchestrator.run(fresh=fresh)
+
+    sys.exit(0 if success else 1)
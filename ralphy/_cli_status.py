@@ -0,0 +1,172 @@
+"""The `ralphy status` command."""
+
+import os
+import sys
+from pathlib import Path
+
+import click
+
+from ralphy.cli import get_console
+from ralphy.constants import FEATURE_NAME_PATTERN
+from ralphy.logger import get_logger
+from ralphy.state import AWAITING_VALIDATION_PHASES, Phase, StateManager, WorkflowState
+
+
+def _phase_style(phase: Phase) -> str:
+    """Returns the Rich style used to display a phase."""
+    if phase in (Phase.FAILED, Phase.REJECTED):
+        return "red"
+    if phase in AWAITING_VALIDATION_PHASES:
+        return "yellow"
+    return "green"
+
+
+def _progress(state: WorkflowState) -> str:
+    """Returns 'completed/total' or '-' when no tasks are known."""
+    return f"{state.tasks_completed}/{state.tasks_total}" if state.tasks_total > 0 else "-"
+
+
+def _print_all_plain(states: list[tuple[str, WorkflowState]]) -> None:
+    """Prints all features as tab-separated lines (non-interactive output)."""
+    lines = ["feature\tphase\tprogress\tlast_completed"]
+    for fname, state in states:
+        lines.append(
+            f"{fname}\t{state.phase.value}\t{_progress(state)}\t{state.last_completed_phase or '-'}"
+        )
+    click.echo("\n".join(lines))
+
+
+def _print_all_table(states: list[tuple[str, WorkflowState]]) -> None:
+    """Prints all features as a Rich table."""
+    from rich.table import Table
+
+    table = Table(title="Ralphy Features Status")
+    table.add_column("Feature", style="cyan")
+    table.add_column("Phase", style="green")
+    table.add_column("Progress", style="blue")
+    table.add_column("Last Completed", style="dim")
+
+    for fname, state in states:
+        phase_style = _phase_style(state.phase)
+        table.add_row(
+            fname,
+            f"[{phase_style}]{state.phase.value}[/{phase_style}]",
+            _progress(state),
+            state.last_completed_phase or "-",
+        )
+
+    get_console().print(table)
+
+
+def _print_feature_plain(state: WorkflowState) -> None:
+    """Prints one feature as key=value lines (non-interactive output)."""
+    lines = [f"phase={state.phase.value}", f"status={state.status.value}"]
+    if state.started_at:
+        lines.append(f"started_at={state.started_at}")
+    if state.tasks_total > 0:
+        lines.append(f"tasks={_progress(state)}")
+    if state.last_completed_phase:
+        lines.append(f"last_completed_phase={state.last_completed_phase}")
+    if state.error_message:
+        lines.append(f"error={state.error_message}")
+    click.echo("\n".join(lines))
+
+
+def _print_feature_table(feature_name: str, state: WorkflowState) -> None:
+    """Prints one feature as a Rich table, with restart hints on failure."""
+    from rich.table import Table
+
+    console = get_console()
+
+    table = Table(title=f"Statut Ralphy - {feature_name}")
+    table.add_column("Propriété", style="cyan")
+    table.add_column("Valeur", style="green")
+
+    # Style selon la phase
+    phase_style = _phase_style(state.phase)
+
+    table.add_row("Phase", f"[{phase_style}]{state.phase.value}[/{phase_style}]")
+    table.add_row("Statut", state.status.value)
+
+    if state.started_at:
+        table.add_row("Démarré", state.started_at)
+
+    if state.tasks_total > 0:
+        table.add_row("Tâches", _progress(state))
+
+    if state.last_completed_phase:
+        table.add_row("Dernière phase complétée", f"[cyan]{state.last_completed_phase}[/cyan]")
+
+    if state.error_message:
+        table.add_row("Erreur", f"[red]{state.error_message}[/red]")
+
+    console.print(table)
+
+    # Hint pour redémarrer si le workflow est terminé en échec
+    if state.phase in (Phase.FAILED, Phase.REJECTED):
+        console.print()
+        if state.last_completed_phase:
+            console.print(
+                f"[dim]💡 Pour reprendre le workflow: [cyan]ralphy start {feature_name}[/cyan][/dim]"
+            )
+            console.print(
+                f"[dim]💡 Pour redémarrer de zéro: [cyan]ralphy start {feature_name} --fresh[/cyan][/dim]"
+            )
+        else:
+            console.print(
+                f"[dim]💡 Pour relancer le workflow: [cyan]ralphy start {feature_name}[/cyan][/dim]"
+            )
+
+
+@click.command("status")
+@click.argument("feature_name", type=str, required=False)
+@click.option("--all", "show_all", is_flag=True, help="Affiche le statut de toutes les features")
+def cmd(feature_name: str = None, show_all: bool = False):
+    """Affiche le statut du workflow.
+
+    FEATURE_NAME: Nom de la feature (requis sauf si --all)
+    """
+    project = Path.cwd()
+    logger = get_logger()
+    console = get_console()
+
+    # Piped/redirected output: plain text, no Rich table rendering
+    interactive = console.is_terminal
+
+    if show_all:
+        # Show status for all features
+        features_dir = os.path.join(str(project), "docs", "features")
+        if not os.path.isdir(features_dir):
+            console.print("[yellow]No features found.[/yellow]")
+            console.print(f"[dim]Create a feature with: mkdir -p docs/features/<feature-name> && touch docs/features/<feature-name>/PRD.md[/dim]")
+            return
+
+        with os.scandir(features_dir) as entries:
+            features = [entry.name for entry in entries if entry.is_dir()]
+        if not features:
+            console.print("[yellow]No features found.[/yellow]")
+            return
+
+        states = [(fname, StateManager(project, fname).state) for fname in sorted(features)]
+        if interactive:
+            _print_all_table(states)
+        else:
+            _print_all_plain(states)
+        return
+
+    # Single feature status
+    if not feature_name:
+        logger.error("Feature name required. Use --all to show all features.")
+        sys.exit(1)
+
+    # Validate feature name
+    if not FEATURE_NAME_PATTERN.match(feature_name):
+        logger.error(f"Invalid feature name: {feature_name}")
+        sys.exit(1)
+
+    state = StateManager(project, feature_name).state
+
+    if interactive:
+        _print_feature_table(feature_name, state)
+    else:
+        _print_feature_plain(state)
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
+from enum import StrEnum
+from typing import Callable, Optional
 
 
-class ActivityType(Enum):
-    """Types of activity detected in output."""
+class ActivityType(StrEnum):
+    """Types of activity detected in output.
+
+    A StrEnum: members hash with str's C hash instead of the Python-level
+    Enum.__hash__ in OutputParser's per-type lookups, and the values stay
+    the strings written to the journal.
+    """
 
     IDLE = "idle"
     WRITING_FILE = "writing_file"
@@ -31,7 +36,10 @@ class Activity:
     detail: Optional[str] = None
 
 
-# Activity detection patterns
+# Activity detection patterns.
+# "a.*b.*c" line checks are written "^(?>.*?a)(?>.*?b)(?>.*?c)": same lines
+# match, but each line is scanned once instead of backtracking cubically
+# on long lines (stream-json output) that never match.
 ACTIVITY_PATTERNS: dict[ActivityType, list[str]] = {
     ActivityType.WRITING_FILE: [
         r"(?:Writing|Creating|Wrote)\s+[`'\"]?([^\s`'\"]+\.[a-z]+)",
@@ -55,20 +63,20 @@ ACTIVITY_PATTERNS: dict[ActivityType, list[str]] = {
     ],
     ActivityType.TASK_START: [
         r"\*\*Status\*\*:\s*in_progress",  # Detects when a task transitions to in_progress
-        r"###\s*Task\s*([\d.]+).*\[([^\]]+)\]",
+        r"###\s*Task\s*([\d.]+).*\[([^\]]++)\]",
         r"Working on Task\s*([\d.]+)",
         r"Starting Task\s*([\d.]+)",
         r"Implementing Task\s*([\d.]+)",
         r"Now (?:implementing|working on)\s*Task\s*([\d.]+)",
-        r"pending.*→.*in_progress",  # Edit tool changing status
+        r"^(?>.*?pending)(?>.*?→)(?>.*?in_progress)",  # Edit tool changing status
     ],
     ActivityType.TASK_COMPLETE: [
         r"\*\*Status\*\*:\s*completed",
         r"[✓✔]\s*Task",
         r"Task\s*([\d.]+).*completed",
         r"Completed\s*Task\s*([\d.]+)",
-        r"status.*completed",
-        r"in_progress.*→.*completed",  # Edit tool changing status
+        r"^(?>.*?status)(?>.*?completed)",
+        r"^(?>.*?in_progress)(?>.*?→)(?>.*?completed)",  # Edit tool changing status
     ],
     ActivityType.READING_FILE: [
         r"Reading\s+[`'\"]?([^\s`'\"]+)",
@@ -93,6 +101,42 @@ ACTIVITY_PATTERNS: dict[ActivityType, list[str]] = {
 }
 
 
+# Lowercase literals of which every ACTIVITY_PATTERNS pattern needs at
+# least one: output containing none of them cannot match, and parse()
+# returns without running the patterns. Keep in sync with the patterns.
+_ACTIVITY_KEYWORDS: tuple[str, ...] = (
+    "task", "completed", "in_progress",
+    "writ", "wrote", "creating", "editing", "read",
+    "running", "executing", "$", "bundle exec", "rails ",
+    "rspec", "pytest", "npm test", "yarn test", "example",
+    "let me", "i'll", "i will", "analyzing", "checking",
+    "delegat", "use", "using", "invok", "subagent_type",
+)
+
+
+# Order in which OutputParser.parse() tries the activity types.
+# TASK_START/COMPLETE detected first for logging, AGENT_DELEGATION high
+# priority to detect agent handoffs. Within a type, the first listed
+# pattern that matches anywhere in the text wins.
+PARSE_PRIORITY: tuple[ActivityType, ...] = (
+    ActivityType.TASK_START,
+    ActivityType.TASK_COMPLETE,
+    ActivityType.AGENT_DELEGATION,
+    ActivityType.WRITING_FILE,
+    ActivityType.RUNNING_TEST,
+    ActivityType.RUNNING_COMMAND,
+    ActivityType.READING_FILE,
+    ActivityType.THINKING,
+)
+
+# Types always searched in the whole text by parse(), whatever scan_from:
+# their markers drive task checkpoints and journal task events
+_FULL_TEXT_TYPES: frozenset[ActivityType] = frozenset({
+    ActivityType.TASK_START,
+    ActivityType.TASK_COMPLETE,
+})
+
+
 def normalize_agent_name(raw_name: str) -> str:
     """Normalize agent name to canonical hyphenated lowercase form.
 
@@ -169,44 +213,93 @@ def match_agent_name(normalized_name: str, available_agents: list[str]) -> Optio
     return None
 
 
+# Readable description per activity type, from the captured (detail, detail2)
+_DESCRIPTION_BUILDERS: dict[ActivityType, Callable[[Optional[str], Optional[str]], str]] = {
+    ActivityType.TASK_START: lambda d, d2: (
+        f"Task {d}: {d2}" if d2 else f"Starting task {d}" if d else "Starting task"
+    ),
+    ActivityType.TASK_COMPLETE: lambda d, _: f"Completed task {d}" if d else "Task completed",
+    ActivityType.AGENT_DELEGATION: lambda d, _: f"Delegating to {d}" if d else "Delegating to agent",
+    ActivityType.WRITING_FILE: lambda d, _: f"Writing {d}" if d else "Writing file",
+    ActivityType.RUNNING_TEST: lambda d, _: "Running tests",
+    ActivityType.RUNNING_COMMAND: lambda d, _: f"Running: {d}" if d else "Running command",
+    ActivityType.READING_FILE: lambda d, _: f"Reading {d}" if d else "Reading file",
+    ActivityType.THINKING: lambda d, _: "Analyzing...",
+}
+
+
+def _original_group(match: re.Match, text: str, index: int) -> Optional[str]:
+    """Returns group `index` of a match on (possibly folded) text, sliced from text."""
+    if not match.lastindex or match.lastindex < index:
+        return None
+    start, end = match.span(index)
+    return text[start:end] if start >= 0 else None
+
+
+def _compile_activity_patterns(
+    fold: bool,
+) -> tuple[tuple[ActivityType, tuple[re.Pattern, ...]], ...]:
+    """Compiles ACTIVITY_PATTERNS, case-insensitive or folded, in PARSE_PRIORITY order.
+
+    Folded patterns are lowercased and compiled without IGNORECASE, to run
+    on lowercased text. IGNORECASE disables SRE's literal-prefix search
+    (every offset of the output gets tried), so the folded variant is
+    several times faster on long output. Lowercasing the sources is safe:
+    they only use lowercase escapes (\\s, \\d, \\w) and classes.
+    """
+    if fold:
+        def compile_pattern(p: str) -> re.Pattern:
+            return re.compile(p.lower(), re.MULTILINE)
+    else:
+        def compile_pattern(p: str) -> re.Pattern:
+            return re.compile(p, re.IGNORECASE | re.MULTILINE)
+
+    return tuple(
+        (activity_type, tuple(compile_pattern(p) for p in ACTIVITY_PATTERNS[activity_type]))
+        for activity_type in PARSE_PRIORITY
+    )
+
+
+# Compiled once per process, shared by every OutputParser
+_COMPILED_PATTERNS = _compile_activity_patterns(fold=False)
+_FOLDED_PATTERNS = _compile_activity_patterns(fold=True)
+
+
 class OutputParser:
     """Parses Claude output to detect activities."""
 
     def __init__(self):
-        self._compiled_patterns: dict[ActivityType, list[re.Pattern]] = {}
-        self._compile_patterns()
-
-    def _compile_patterns(self) -> None:
-        """Compiles regex patterns."""
-        for activity_type, patterns in ACTIVITY_PATTERNS.items():
-            self._compiled_patterns[activity_type] = [
-                re.compile(p, re.IGNORECASE | re.MULTILINE) for p in patterns
-            ]
-
-    def parse(self, text: str) -> Optional[Activity]:
-        """Parses text and returns detected activity."""
-        # Priority: TASK_START/COMPLETE detected first for logging,
-        # AGENT_DELEGATION high priority to detect agent handoffs
-        priority_order = [
-            ActivityType.TASK_START,
-            ActivityType.TASK_COMPLETE,
-            ActivityType.AGENT_DELEGATION,
-            ActivityType.WRITING_FILE,
-            ActivityType.RUNNING_TEST,
-            ActivityType.RUNNING_COMMAND,
-            ActivityType.READING_FILE,
-            ActivityType.THINKING,
-        ]
-
-        for activity_type in priority_order:
-            patterns = self._compiled_patterns.get(activity_type, [])
+        self._compiled_patterns = _COMPILED_PATTERNS
+        self._folded_patterns = _FOLDED_PATTERNS
+
+    def parse(self, text: str, scan_from: int = 0) -> Optional[Activity]:
+        """Parses text and returns detected activity.
+
+        Args:
+            text: Output text to parse.
+            scan_from: Offset (at a line start) from which the types other
+                than TASK_START/TASK_COMPLETE are searched. Task markers
+                are always searched in the whole text.
+        """
+        folded = text.lower()
+        if len(folded) == len(text):
+            if not any(keyword in folded for keyword in _ACTIVITY_KEYWORDS):
+                return None
+            compiled, subject = self._folded_patterns, folded
+        else:
+            # Some characters (e.g. "İ") lowercase to several code points:
+            # spans on the folded text would not line up with the original
+            compiled, subject = self._compiled_patterns, text
+
+        for activity_type, patterns in compiled:
+            pos = 0 if activity_type in _FULL_TEXT_TYPES else scan_from
             for pattern in patterns:
-                match = pattern.search(text)
+                match = pattern.search(subject, pos)
                 if match:
-                    # Extract captured groups
-                    detail = match.group(1) if match.lastindex and match.lastindex >= 1 else None
+                    # Extract captured groups, with their original case
+                    detail = _original_group(match, text, 1)
                     # For TASK_START, group 2 contains the task name
-                    detail2 = match.group(2) if match.lastindex and match.lastindex >= 2 else None
+                    detail2 = _original_group(match, text, 2)
                     return Activity(
                         type=activity_type,
                         description=self._get_description(activity_type, detail, detail2),
@@ -219,17 +312,8 @@ class OutputParser:
         self, activity_type: ActivityType, detail: Optional[str], detail2: Optional[str] = None
     ) -> str:
         """Generates a readable activity description."""
-        descriptions = {
-            ActivityType.TASK_START: f"Task {detail}: {detail2}" if detail2 else f"Starting task {detail}" if detail else "Starting task",
-            ActivityType.TASK_COMPLETE: f"Completed task {detail}" if detail else "Task completed",
-            ActivityType.AGENT_DELEGATION: f"Delegating to {detail}" if detail else "Delegating to agent",
-            ActivityType.WRITING_FILE: f"Writing {detail}" if detail else "Writing file",
-            ActivityType.RUNNING_TEST: "Running tests",
-            ActivityType.RUNNING_COMMAND: f"Running: {detail}" if detail else "Running command",
-            ActivityType.READING_FILE: f"Reading {detail}" if detail else "Reading file",
-            ActivityType.THINKING: "Analyzing...",
-        }
-        return descriptions.get(activity_type, "Working...")
+        build = _DESCRIPTION_BUILDERS.get(activity_type)
+        return build(detail, detail2) if build else "Working..."
 
     def parse_all_completions(self, text: str) -> list[str]:
         """Extract all completed task IDs from text.
@@ -289,10 +289,10 @@ If a task in TASKS.md specifies `- **TDD**: true` or `- **TDD**: false`, follow
 
     def read_file(self, filename: str) -> Optional[str]:
         """Reads a file from the project."""
-        filepath = self.project_path / filename
-        if filepath.exists():
-            return filepath.read_text(encoding="utf-8")
-        return None
+        try:
+            return (self.project_path / filename).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
 
     def read_feature_file(self, filename: str) -> Optional[str]:
         """Read a file from the feature directory.
@@ -305,10 +305,10 @@ If a task in TASKS.md specifies `- **TDD**: true` or `- **TDD**: false`, follow
         """
         if not self.feature_dir:
             return None
-        filepath = self.feature_dir / filename
-        if filepath.exists():
-            return filepath.read_text(encoding="utf-8")
-        return None
+        try:
+            return (self.feature_dir / filename).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
 
     def run(
         self,
@@ -7,6 +7,7 @@ from typing import Optional, Tuple
 import yaml
 
 from ralphy.agents.base import AgentResult, BaseAgent
+from ralphy.agents.tasks import count_task_status
 from ralphy.claude import ClaudeResponse
 
 
@@ -185,17 +186,10 @@ You remain responsible for TASKS.md updates and overall completion.
         )
 
     def count_task_status(self) -> Tuple[int, int]:
-        """Counts completed tasks and total."""
-        tasks_content = self.read_feature_file("TASKS.md")
-        if not tasks_content:
+        """Counts completed tasks and total (see ralphy.agents.tasks)."""
+        if not self.feature_dir:
             return 0, 0
-
-        # Count total tasks (format: ### Task X.Y or ## Task X)
-        total = len(re.findall(r"#{2,3}\s*Task\s*[\d.]+", tasks_content, re.IGNORECASE))
-        # Count completed tasks
-        completed = len(re.findall(r"\*\*Status\*\*:\s*completed", tasks_content, re.IGNORECASE))
-
-        return completed, total
+        return count_task_status(self.feature_dir / "TASKS.md")
 
     def get_in_progress_task(self) -> str | None:
         """Returns the ID of the in_progress task if there is one."""
@@ -0,0 +1,60 @@
+"""TASKS.md status counting, shared by DevAgent and the orchestrator."""
+
+import re
+from pathlib import Path
+
+# Task headers: "## Task X" or "### Task X.Y". Bytes patterns: the file is
+# scanned as read, without decoding it.
+_TASK_HEADER_RE = re.compile(rb"#{2,3}\s*Task\s*[\d.]+", re.IGNORECASE)
+_COMPLETED_STATUS_RE = re.compile(rb"\*\*Status\*\*:\s*completed", re.IGNORECASE)
+
+# TASKS.md path -> ((mtime_ns, size), (completed, total)) of its last parse
+_status_cache: dict[Path, tuple[tuple[int, int], tuple[int, int]]] = {}
+
+
+def parse_task_status(content: bytes) -> tuple[int, int]:
+    """Counts completed tasks and total in TASKS.md content.
+
+    Args:
+        content: The UTF-8 encoded TASKS.md content.
+
+    Returns:
+        Tuple of (completed, total).
+    """
+    total = sum(1 for _ in _TASK_HEADER_RE.finditer(content))
+    completed = sum(1 for _ in _COMPLETED_STATUS_RE.finditer(content))
+    return completed, total
+
+
+def count_task_status(tasks_path: Path) -> tuple[int, int]:
+    """Counts completed tasks and total in a TASKS.md file.
+
+    The file is only re-parsed when its mtime or size changed since the
+    previous count, so repeated calls (task poller, phase end, resume)
+    cost one stat() while it is unchanged.
+
+    Args:
+        tasks_path: Path to TASKS.md.
+
+    Returns:
+        Tuple of (completed, total), (0, 0) if the file does not exist.
+    """
+    try:
+        st = tasks_path.stat()
+    except FileNotFoundError:
+        return 0, 0
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _status_cache.get(tasks_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    # No mmap: the agent rewrites TASKS.md while the poller reads it, and
+    # a mapped file truncated mid-scan raises SIGBUS, not an exception
+    try:
+        content = tasks_path.read_bytes()
+    except FileNotFoundError:
+        # Removed since the stat()
+        return 0, 0
+    status = parse_task_status(content)
+    _status_cache[tasks_path] = (signature, status)
+    return status
@@ -1,11 +1,10 @@
 """Ralphy project configuration management."""
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 from ralphy.constants import (
     AGENT_TIMEOUT_SECONDS,
     CB_INACTIVITY_TIMEOUT_SECONDS,
@@ -43,14 +42,35 @@ def validate_model(model: str) -> str:
     Returns:
         The validated model name, or 'sonnet' if invalid
     """
-    if model in ALLOWED_MODELS:
-        return model
-    logger = get_logger()
-    logger.warn(f"Invalid model '{model}' - falling back to 'sonnet'")
+    return model if _is_allowed_model(model) else _warn_invalid_model(model)
+
+
+# Hot path: bound frozenset membership test, no extra Python frame
+_is_allowed_model = ALLOWED_MODELS.__contains__
+
+
+def _warn_invalid_model(model: str) -> str:
+    """Cold path of validate_model: warns and returns the 'sonnet' fallback."""
+    get_logger().warn(f"Invalid model '{model}' - falling back to 'sonnet'")
     return "sonnet"
 
 
-@dataclass
+def _from_section(default, data: dict):
+    """Instancie une sous-config depuis sa section YAML.
+
+    Les clés absentes prennent les valeurs par défaut du dataclass, les clés
+    inconnues sont ignorées. Une section sans surcharge réutilise l'instance
+    par défaut partagée.
+    """
+    section_cls = type(default)
+    fields = section_cls.__dataclass_fields__
+    values = {key: value for key, value in data.items() if key in fields}
+    if not values:
+        return default
+    return section_cls(**values)
+
+
+@dataclass(frozen=True, slots=True)
 class TimeoutConfig:
     """Timeout configuration in seconds.
 
@@ -66,7 +86,7 @@ class TimeoutConfig:
     agent: int = AGENT_TIMEOUT_SECONDS  # 5 min - Fallback (BaseAgent.run)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """Agent retry configuration.
 
@@ -78,7 +98,7 @@ class RetryConfig:
     delay_seconds: int = DEFAULT_RETRY_DELAY_SECONDS  # Delay between retries
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CircuitBreakerConfig:
     """Circuit breaker configuration.
 
@@ -98,7 +118,7 @@ class CircuitBreakerConfig:
     max_attempts: int = CB_MAX_ATTEMPTS  # Warnings before trip
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Configuration des modèles Claude par phase.
 
@@ -112,7 +132,7 @@ class ModelConfig:
     pr: str = "sonnet"  # Phase 4: pr-agent
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StackConfig:
     """Configuration de la stack technique."""
 
@@ -120,134 +140,132 @@ class StackConfig:
     test_command: str = "npm test"
 
 
-@dataclass
+# Shared default sections: configs are immutable, so every ProjectConfig
+# without an override for a section reuses the same instance
+DEFAULT_TIMEOUTS = TimeoutConfig()
+DEFAULT_MODELS = ModelConfig()
+DEFAULT_STACK = StackConfig()
+DEFAULT_RETRY = RetryConfig()
+DEFAULT_CIRCUIT_BREAKER = CircuitBreakerConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class ProjectConfig:
     """Configuration complète du projet."""
 
     name: str = "my-project"
-    timeouts: TimeoutConfig = field(default_factory=TimeoutConfig)
-    models: ModelConfig = field(default_factory=ModelConfig)
-    stack: StackConfig = field(default_factory=StackConfig)
-    retry: RetryConfig = field(default_factory=RetryConfig)
-    circuit_breaker: CircuitBreakerConfig = field(default_factory=CircuitBreakerConfig)
+    timeouts: TimeoutConfig = DEFAULT_TIMEOUTS
+    models: ModelConfig = DEFAULT_MODELS
+    stack: StackConfig = DEFAULT_STACK
+    retry: RetryConfig = DEFAULT_RETRY
+    circuit_breaker: CircuitBreakerConfig = DEFAULT_CIRCUIT_BREAKER
 
     @classmethod
     def from_dict(cls, data: dict) -> "ProjectConfig":
         """Crée une config depuis un dictionnaire."""
-        timeouts_data = data.get("timeouts", {})
-        models_data = data.get("models", {})
-        stack_data = data.get("stack", {})
-        project_data = data.get("project", {})
-        retry_data = data.get("retry", {})
-        cb_data = data.get("circuit_breaker", {})
-
-        timeouts = TimeoutConfig(
-            specification=timeouts_data.get("specification", SPEC_TIMEOUT_SECONDS),
-            implementation=timeouts_data.get("implementation", IMPL_TIMEOUT_SECONDS),
-            qa=timeouts_data.get("qa", QA_TIMEOUT_SECONDS),
-            pr=timeouts_data.get("pr", PR_TIMEOUT_SECONDS),
-            agent=timeouts_data.get("agent", AGENT_TIMEOUT_SECONDS),
-        )
-
-        models = ModelConfig(
-            specification=validate_model(models_data.get("specification", "sonnet")),
-            implementation=validate_model(models_data.get("implementation", "sonnet")),
-            qa=validate_model(models_data.get("qa", "sonnet")),
-            pr=validate_model(models_data.get("pr", "sonnet")),
-        )
-
-        stack = StackConfig(
-            language=stack_data.get("language", "typescript"),
-            test_command=stack_data.get("test_command", "npm test"),
-        )
-
-        retry = RetryConfig(
-            max_attempts=retry_data.get("max_attempts", DEFAULT_RETRY_ATTEMPTS),
-            delay_seconds=retry_data.get("delay_seconds", DEFAULT_RETRY_DELAY_SECONDS),
-        )
-
-        circuit_breaker = CircuitBreakerConfig(
-            enabled=cb_data.get("enabled", True),
-            inactivity_timeout=cb_data.get("inactivity_timeout", CB_INACTIVITY_TIMEOUT_SECONDS),
-            max_repeated_errors=cb_data.get("max_repeated_errors", CB_MAX_REPEATED_ERRORS),
-            task_stagnation_timeout=cb_data.get("task_stagnation_timeout", CB_TASK_STAGNATION_TIMEOUT_SECONDS),
-            max_output_size=cb_data.get("max_output_size", CB_MAX_OUTPUT_SIZE_BYTES),
-            max_attempts=cb_data.get("max_attempts", CB_MAX_ATTEMPTS),
-        )
+        models_data = data.get("models") or {}
+        models = _from_section(DEFAULT_MODELS, {
+            key: value if _is_allowed_model(value) else _warn_invalid_model(value)
+            for key, value in models_data.items()
+        })
 
         return cls(
-            name=project_data.get("name", "my-project"),
-            timeouts=timeouts,
+            name=(data.get("project") or {}).get("name", "my-project"),
+            timeouts=_from_section(DEFAULT_TIMEOUTS, data.get("timeouts") or {}),
             models=models,
-            stack=stack,
-            retry=retry,
-            circuit_breaker=circuit_breaker,
+            stack=_from_section(DEFAULT_STACK, data.get("stack") or {}),
+            retry=_from_section(DEFAULT_RETRY, data.get("retry") or {}),
+            circuit_breaker=_from_section(DEFAULT_CIRCUIT_BREAKER, data.get("circuit_breaker") or {}),
         )
 
     def to_dict(self) -> dict:
         """Convertit la config en dictionnaire."""
-        return {
-            "project": {"name": self.name},
-            "timeouts": {
-                "specification": self.timeouts.specification,
-                "implementation": self.timeouts.implementation,
-                "qa": self.timeouts.qa,
-                "pr": self.timeouts.pr,
-                "agent": self.timeouts.agent,
-            },
-            "models": {
-                "specification": self.models.specification,
-                "implementation": self.models.implementation,
-                "qa": self.models.qa,
-                "pr": self.models.pr,
-            },
-            "stack": {
-                "language": self.stack.language,
-                "test_command": self.stack.test_command,
-            },
-            "retry": {
-                "max_attempts": self.retry.max_attempts,
-                "delay_seconds": self.retry.delay_seconds,
-            },
-            "circuit_breaker": {
-                "enabled": self.circuit_breaker.enabled,
-                "inactivity_timeout": self.circuit_breaker.inactivity_timeout,
-                "max_repeated_errors": self.circuit_breaker.max_repeated_errors,
-                "task_stagnation_timeout": self.circuit_breaker.task_stagnation_timeout,
-                "max_output_size": self.circuit_breaker.max_output_size,
-                "max_attempts": self.circuit_breaker.max_attempts,
-            },
-        }
+        data = asdict(self)
+        return {"project": {"name": data.pop("name")}, **data}
+
+
+@cache
+def _yaml_codecs() -> tuple:
+    """Imports PyYAML on first use and returns its (SafeLoader, SafeDumper).
+
+    Uses the libyaml C bindings when available. Importing ralphy.config for
+    its dataclasses or path helpers does not pay the PyYAML import.
+    """
+    try:
+        from yaml import CSafeDumper, CSafeLoader
+        return CSafeLoader, CSafeDumper
+    except ImportError:  # pragma: no cover - depends on the PyYAML build
+        from yaml import SafeDumper, SafeLoader
+        return SafeLoader, SafeDumper
+
+
+# Parsed configs keyed by config path, invalidated by
+# (st_mtime_ns, st_ctime_ns, st_size, st_ino)
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int, int, int], ProjectConfig]] = {}
 
 
 def load_config(project_path: Path) -> ProjectConfig:
-    """Charge la configuration depuis .ralphy/config.yaml."""
+    """Charge la configuration depuis .ralphy/config.yaml.
+
+    Le résultat est mis en cache tant que le fichier n'est pas modifié
+    (mtime, ctime, taille et inode), un appel répété ne coûte alors
+    qu'un stat().
+    """
     config_path = project_path / ".ralphy" / "config.yaml"
 
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        _CONFIG_CACHE.pop(config_path, None)
         return ProjectConfig()
 
+    key = (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    import yaml
+
+    loader, _ = _yaml_codecs()
     with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=loader) or {}
 
-    return ProjectConfig.from_dict(data)
+    config = ProjectConfig.from_dict(data)
+    _CONFIG_CACHE[config_path] = (key, config)
+    return config
 
 
 def save_config(project_path: Path, config: ProjectConfig) -> None:
     """Sauvegarde la configuration dans .ralphy/config.yaml."""
-    ralph_dir = project_path / ".ralphy"
-    ralph_dir.mkdir(parents=True, exist_ok=True)
+    ralph_dir = ensure_ralph_dir(project_path)
 
+    import yaml
+
+    _, dumper = _yaml_codecs()
     config_path = ralph_dir / "config.yaml"
     with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(config.to_dict(), f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(
+            config.to_dict(), f, Dumper=dumper,
+            default_flow_style=False, allow_unicode=True,
+        )
+    _CONFIG_CACHE.pop(config_path, None)
+
+
+# Directories already created by this process (skips repeated makedirs walks)
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Creates path (and parents) once per process and returns it."""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
 
 
 def ensure_ralph_dir(project_path: Path) -> Path:
     """S'assure que le dossier .ralphy existe et retourne son chemin."""
-    ralph_dir = project_path / ".ralphy"
-    ralph_dir.mkdir(parents=True, exist_ok=True)
-    return ralph_dir
+    return _ensure_dir(project_path / ".ralphy")
 
 
 def get_feature_dir(project_path: Path, feature_name: str) -> Path:
@@ -280,6 +298,4 @@ def ensure_feature_dir(project_path: Path, feature_name: str) -> Path:
     Raises:
         ValueError: If feature_name contains invalid characters or path traversal attempts.
     """
-    feature_dir = get_feature_dir(project_path, feature_name)
-    feature_dir.mkdir(parents=True, exist_ok=True)
-    return feature_dir
+    return _ensure_dir(get_feature_dir(project_path, feature_name))
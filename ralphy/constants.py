@@ -24,7 +24,12 @@ def validate_feature_name(feature_name: str) -> None:
     Raises:
         ValueError: If the feature name contains invalid characters or patterns.
     """
-    # Check for path traversal patterns
+    # Fast path: the character class already excludes '.', '/' and '\\',
+    # so a single match covers the traversal checks for valid names
+    if FEATURE_NAME_PATTERN.match(feature_name):
+        return
+
+    # Slow path: report the most specific reason
     if ".." in feature_name:
         raise ValueError(f"Invalid feature name: contains '..': {feature_name}")
     if "/" in feature_name:
@@ -32,12 +37,11 @@ def validate_feature_name(feature_name: str) -> None:
     if "\\" in feature_name:
         raise ValueError(f"Invalid feature name: contains '\\': {feature_name}")
 
-    # Check pattern - must start with alphanumeric, contain only safe characters
-    if not FEATURE_NAME_PATTERN.match(feature_name):
-        raise ValueError(
-            f"Invalid feature name format: {feature_name}. "
-            "Must start with alphanumeric and contain only alphanumeric, hyphens, or underscores."
-        )
+    # Pattern mismatch - must start with alphanumeric, contain only safe characters
+    raise ValueError(
+        f"Invalid feature name format: {feature_name}. "
+        "Must start with alphanumeric and contain only alphanumeric, hyphens, or underscores."
+    )
 
 # =============================================================================
 # TIMEOUT DEFAULTS (seconds)
@@ -90,6 +94,7 @@ MIN_PROMPT_SIZE_CHARS = 100  # Minimum characters for a valid custom prompt
 # =============================================================================
 
 SPEC_PREVIEW_LINES = 20  # Lines to show in spec validation summary
+PROGRESS_SCAN_WINDOW_CHARS = 8192  # Output tail scanned for activity per chunk
 
 # =============================================================================
 # TOKEN TRACKING DEFAULTS
@@ -104,3 +109,17 @@ DEFAULT_MAX_OUTPUT_TOKENS = 64000  # Claude max output tokens
 
 JOURNAL_FILE = "progress.jsonl"  # Real-time event log (append-only)
 JOURNAL_SUMMARY_FILE = "progress_summary.json"  # Aggregate summary at workflow end
+
+RUN_LOCK_FILE = "run.lock"  # Advisory lock held by the running workflow (in .ralphy/)
+
+# Event batching: buffered events are written when any threshold is reached
+JOURNAL_BATCH_MAX_EVENTS = 64  # Events held before a write
+JOURNAL_BATCH_MAX_BYTES = 65536  # Serialized bytes held before a write
+JOURNAL_BATCH_MAX_DELAY_SECONDS = 0.05  # Max age of the previous write
+JOURNAL_WRITER_JOIN_TIMEOUT_SECONDS = 5.0  # Wait for the writer thread at workflow end
+JOURNAL_TOKEN_UPDATE_INTERVAL_SECONDS = 1.0  # Min interval between persisted token updates
+
+# State batching (StateManager.batch): deferred task counter updates are saved
+# when a deferred save finds a threshold reached, and always when the batch ends
+STATE_BATCH_MAX_WRITES = 8  # Deferred saves held before a write
+STATE_BATCH_MAX_DELAY_SECONDS = 5.0  # Max age of the oldest deferred save
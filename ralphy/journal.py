@@ -6,19 +6,74 @@ events during Ralphy workflows and persists them for later analysis.
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import queue
 import threading
+import weakref
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from time import monotonic
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional
+
+from ralphy.constants import (
+    JOURNAL_BATCH_MAX_BYTES,
+    JOURNAL_BATCH_MAX_DELAY_SECONDS,
+    JOURNAL_BATCH_MAX_EVENTS,
+    JOURNAL_TOKEN_UPDATE_INTERVAL_SECONDS,
+    JOURNAL_WRITER_JOIN_TIMEOUT_SECONDS,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
     from ralphy.claude import TokenUsage
     from ralphy.progress import Activity
 
 
+# JSONL record separator, appended to each serialized event
+_NL = b"\n"
+
+# JSON encoders returning UTF-8 bytes: orjson when installed, stdlib otherwise
+if orjson is not None:
+    def _dumps_event(event: JournalEvent) -> bytes:
+        """Serialize an event straight from its slots (no to_dict() copy)."""
+        return orjson.dumps(event)
+
+    # orjson >= 3.5 appends the newline in its own output buffer
+    _OPT_APPEND_NEWLINE = getattr(orjson, "OPT_APPEND_NEWLINE", 0)
+    if _OPT_APPEND_NEWLINE:
+        def _dumps_line(event: JournalEvent) -> bytes:
+            """Serialize an event to a JSONL record (newline included)."""
+            return orjson.dumps(event, option=_OPT_APPEND_NEWLINE)
+    else:  # pragma: no cover - old orjson
+        def _dumps_line(event: JournalEvent) -> bytes:
+            """Serialize an event to a JSONL record (newline included)."""
+            return orjson.dumps(event) + _NL
+
+    def _dumps_indented(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes indented by 2 spaces."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _dumps_event(event: JournalEvent) -> bytes:
+        """Serialize an event to compact JSON bytes."""
+        return json.dumps(event.to_dict()).encode("utf-8")
+
+    def _dumps_line(event: JournalEvent) -> bytes:
+        """Serialize an event to a JSONL record (newline included)."""
+        return _dumps_event(event) + _NL
+
+    def _dumps_indented(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes indented by 2 spaces."""
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
 class EventType(str, Enum):
     """Types of events that can be recorded in the journal."""
 
@@ -36,7 +91,11 @@ class EventType(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+# Plain string of each event type, read once per event by to_dict()
+_EVENT_TYPE_VALUES: dict[EventType, str] = {e: e.value for e in EventType}
+
+
+@dataclass(slots=True)
 class JournalEvent:
     """A single event in the workflow journal."""
 
@@ -49,7 +108,7 @@ class JournalEvent:
         """Convert event to dictionary for JSON serialization."""
         return {
             "timestamp": self.timestamp,
-            "event_type": self.event_type.value,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
             "phase": self.phase,
             "data": self.data,
         }
@@ -65,7 +124,7 @@ class JournalEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseSummary:
     """Summary of a single phase execution."""
 
@@ -100,7 +159,7 @@ class PhaseSummary:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowSummary:
     """Summary of the entire workflow execution."""
 
@@ -138,11 +197,31 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# Live journals and writers, flushed at interpreter exit so queued and
+# buffered events are not lost
+_open_journals: weakref.WeakSet[WorkflowJournal] = weakref.WeakSet()
+_open_writers: weakref.WeakSet[JournalWriter] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_writers() -> None:
+    """Drain every live WorkflowJournal, then flush every JournalWriter (atexit hook)."""
+    for journal in list(_open_journals):
+        journal.flush()
+    for writer in list(_open_writers):
+        writer.flush()
+
+
 class JournalWriter:
     """Handles file I/O operations for the workflow journal.
 
     Encapsulates all file operations (JSONL append, JSON write) to follow
     the Single Responsibility Principle. Thread-safe file operations.
+
+    Events are buffered in memory and written in batches: a write happens
+    when JOURNAL_BATCH_MAX_EVENTS events or JOURNAL_BATCH_MAX_BYTES bytes
+    are pending, when the previous write is older than
+    JOURNAL_BATCH_MAX_DELAY_SECONDS, or when flush() is called.
     """
 
     def __init__(self, journal_path: Path, summary_path: Path):
@@ -154,25 +233,127 @@ class JournalWriter:
         """
         self._journal_path = journal_path
         self._summary_path = summary_path
+        self._lock = threading.Lock()
+        self._buffer: list[bytes] = []
+        self._buffer_bytes = 0
+        self._last_flush = 0.0
+        self._fh: Optional[BinaryIO] = None
+        self._dir_ready = False
+        _open_writers.add(self)
 
     def _ensure_dir(self) -> None:
         """Ensure the parent directory exists."""
         self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self._dir_ready = True
+
+    def _open_file(self, path: Path, mode: str) -> BinaryIO:
+        """Open a file in the journal directory, creating the directory once.
+
+        If the directory was removed since it was created, it is recreated
+        and the open retried once.
+        """
+        if not self._dir_ready:
+            self._ensure_dir()
+        try:
+            return open(path, mode)
+        except FileNotFoundError:
+            self._ensure_dir()
+            return open(path, mode)
+
+    def _open(self) -> BinaryIO:
+        """Return the JSONL handle, opening it (and its directory) on first use.
+
+        Caller must hold self._lock.
+        """
+        if self._fh is None:
+            self._fh = self._open_file(self._journal_path, "ab")
+        return self._fh
+
+    def _close_locked(self) -> None:
+        """Close the JSONL handle if open. Caller must hold self._lock."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
     def clear_journal(self) -> None:
-        """Clear the journal file (for fresh starts)."""
-        if self._journal_path.exists():
-            self._journal_path.unlink()
+        """Clear the journal file (for fresh starts).
+
+        Pending buffered events belong to the cleared journal and are dropped.
+        """
+        with self._lock:
+            self._buffer.clear()
+            self._buffer_bytes = 0
+            self._close_locked()
+            if self._journal_path.exists():
+                self._journal_path.unlink()
 
-    def append_event(self, event: JournalEvent) -> None:
+    def append_event(self, event: JournalEvent, flush: bool = False) -> None:
         """Append a single event to the JSONL file.
 
         Args:
             event: The event to append
+            flush: Write the pending batch immediately (boundary events)
+        """
+        self.append_batch([event], flush=flush)
+
+    def append_batch(self, events: list[JournalEvent], flush: bool = False) -> None:
+        """Append several events to the JSONL file, in order.
+
+        Args:
+            events: The events to append
+            flush: Write the pending batch immediately (boundary events)
         """
-        self._ensure_dir()
-        with open(self._journal_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event.to_dict()) + "\n")
+        lines = [_dumps_line(event) for event in events]
+        with self._lock:
+            self._buffer.extend(lines)
+            self._buffer_bytes += sum(map(len, lines))
+            if (
+                flush
+                or len(self._buffer) >= JOURNAL_BATCH_MAX_EVENTS
+                or self._buffer_bytes >= JOURNAL_BATCH_MAX_BYTES
+                or monotonic() - self._last_flush >= JOURNAL_BATCH_MAX_DELAY_SECONDS
+            ):
+                self._flush_locked()
+
+    def _flush_locked(self, fsync: bool = False) -> None:
+        """Write pending events in a single write. Caller must hold self._lock.
+
+        Args:
+            fsync: Also force the file to disk (durability checkpoints)
+        """
+        if self._buffer:
+            fh = self._open()
+            fh.write(b"".join(self._buffer))
+            fh.flush()
+            self._buffer.clear()
+            self._buffer_bytes = 0
+            self._last_flush = monotonic()
+        if fsync and self._fh is not None:
+            os.fsync(self._fh.fileno())
+
+    def flush(self, fsync: bool = False) -> None:
+        """Write all pending events to the JSONL file.
+
+        Args:
+            fsync: Also force the file to disk. Only used after PHASE_END and
+                WORKFLOW_END: other events rely on the OS page cache.
+        """
+        with self._lock:
+            self._flush_locked(fsync)
+
+    @property
+    def has_pending(self) -> bool:
+        """Check if buffered events are waiting to be written."""
+        return bool(self._buffer)
+
+    def close(self) -> None:
+        """Write pending events and close the JSONL handle.
+
+        A later append reopens the file.
+        """
+        with self._lock:
+            self._flush_locked()
+            self._close_locked()
 
     def write_summary(self, summary: WorkflowSummary) -> None:
         """Write the workflow summary to JSON file.
@@ -180,16 +361,21 @@ class JournalWriter:
         Args:
             summary: The workflow summary to write
         """
-        self._ensure_dir()
-        with open(self._summary_path, "w", encoding="utf-8") as f:
-            json.dump(summary.to_dict(), f, indent=2)
+        with self._open_file(self._summary_path, "wb") as f:
+            f.write(_dumps_indented(summary.to_dict()))
 
 
 class WorkflowJournal:
     """Thread-safe journal for workflow progress events.
 
-    Writes events to a JSONL file in real-time and generates a summary
-    JSON file at workflow end. Delegates file I/O to JournalWriter.
+    Writes events to a JSONL file in near real-time (batched, see
+    JournalWriter) and generates a summary JSON file at workflow end.
+    Delegates file I/O to JournalWriter.
+
+    Between start_workflow() and end_workflow(), record_* methods only
+    enqueue events: a daemon writer thread drains the queue and does the
+    file I/O, so producers never wait on the disk. Lifecycle events wait
+    until they are written.
 
     Files are written to .ralphy/ directory within the feature directory:
     - progress.jsonl: Real-time event log (append-only)
@@ -209,7 +395,16 @@ class WorkflowJournal:
         self._summary: Optional[WorkflowSummary] = None
         self._current_phase: Optional[PhaseSummary] = None
         self._current_phase_name: Optional[str] = None
+        # Only ever goes False -> True, so record_* can check it without the
+        # lock first (and re-check under the lock)
         self._started = False
+        # Monotonic start times for durations (immune to wall-clock jumps)
+        self._workflow_start_mono = 0.0
+        self._phase_start_mono = 0.0
+        # Token updates are persisted at most once per interval per phase;
+        # the latest skipped one is kept and written at phase end
+        self._last_token_flush_mono = 0.0
+        self._pending_token_event: Optional[JournalEvent] = None
 
         # Import constants here to avoid circular import
         from ralphy.constants import JOURNAL_FILE, JOURNAL_SUMMARY_FILE
@@ -218,6 +413,137 @@ class WorkflowJournal:
         summary_path = feature_dir / ".ralphy" / JOURNAL_SUMMARY_FILE
         self._writer = JournalWriter(journal_path, summary_path)
 
+        # Events, flush barriers (threading.Event) or None (stop), consumed
+        # by the writer thread started in start_workflow()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer_thread: Optional[threading.Thread] = None
+        # First I/O error hit by the writer thread, raised by the next _sync()
+        self._write_error: Optional[OSError] = None
+
+    def _start_writer_thread(self) -> None:
+        """Start the background writer thread. Caller must hold self._lock."""
+        self._writer_thread = threading.Thread(
+            target=self._drain,
+            name=f"ralphy-journal-{self.feature_name}",
+            daemon=True,
+        )
+        self._writer_thread.start()
+        _open_journals.add(self)
+
+    def _detach_writer_thread(self) -> Optional[threading.Thread]:
+        """Ask the writer thread to stop after the queued events.
+
+        Caller must hold self._lock, then join the returned thread once the
+        lock is released.
+        """
+        thread = self._writer_thread
+        if thread is not None:
+            self._queue.put(None)
+            self._writer_thread = None
+            _open_journals.discard(self)
+        return thread
+
+    def _drain(self) -> None:
+        """Writer thread loop: write queued events in batches until stopped."""
+        q = self._queue
+        writer = self._writer
+        while True:
+            try:
+                # Wake up to honour the batch delay only while events are buffered
+                item = q.get(
+                    timeout=JOURNAL_BATCH_MAX_DELAY_SECONDS if writer.has_pending else None
+                )
+            except queue.Empty:
+                self._write(writer.flush)
+                continue
+
+            batch: list[JournalEvent] = []
+            while True:
+                if item is None:
+                    self._write(writer.append_batch, batch, flush=True)
+                    return
+                if isinstance(item, threading.Event):
+                    self._write(writer.append_batch, batch, flush=True)
+                    batch = []
+                    item.set()
+                elif (
+                    item.event_type is EventType.TOKEN_UPDATE
+                    and batch
+                    and batch[-1].event_type is EventType.TOKEN_UPDATE
+                ):
+                    # Consecutive token snapshots: only the latest is kept
+                    batch[-1] = item
+                else:
+                    batch.append(item)
+                    if len(batch) >= JOURNAL_BATCH_MAX_EVENTS:
+                        self._write(writer.append_batch, batch)
+                        batch = []
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(writer.append_batch, batch)
+
+    def _write(self, func: Any, *args: Any, **kwargs: Any) -> None:
+        """Run a writer call from the writer thread.
+
+        An I/O error drops the events instead of killing the thread (and
+        blocking flush()); the first one is kept and raised by _sync().
+        """
+        try:
+            func(*args, **kwargs)
+        except OSError as e:
+            if self._write_error is None:
+                self._write_error = e
+
+    def _raise_write_error(self) -> None:
+        """Raise the I/O error hit by the writer thread since the last call, if any."""
+        error = self._write_error
+        if error is not None:
+            self._write_error = None
+            raise error
+
+    def _enqueue(self, event: JournalEvent) -> None:
+        """Hand an event to the writer thread. Caller must hold self._lock.
+
+        Putting on the queue under the lock keeps the journal in recording
+        order; lifecycle events then call _sync() after releasing the lock.
+        """
+        if self._writer_thread is None:
+            # Workflow ended: no writer thread, buffer directly
+            self._writer.append_event(event)
+            return
+        self._queue.put(event)
+
+    def _flush_pending_token_event(self) -> None:
+        """Write the last rate-limited token update, if any. Caller must hold self._lock."""
+        if self._pending_token_event is not None:
+            self._enqueue(self._pending_token_event)
+            self._pending_token_event = None
+
+    def _sync(self) -> None:
+        """Wait until every event queued so far is written.
+
+        Called without self._lock so that producers are not blocked while
+        the writer thread does the I/O.
+
+        Raises:
+            OSError: If the writer thread failed to write events
+        """
+        thread = self._writer_thread
+        if thread is None:
+            self._writer.flush()
+        else:
+            done = threading.Event()
+            self._queue.put(done)
+            # end_workflow() may stop the thread concurrently: never wait on a dead one
+            while not done.wait(JOURNAL_BATCH_MAX_DELAY_SECONDS):
+                if not thread.is_alive():
+                    self._writer.flush()
+                    break
+        self._raise_write_error()
+
     def _create_event(
         self,
         event_type: EventType,
@@ -243,6 +569,14 @@ class WorkflowJournal:
             data=data,
         )
 
+    def _build_event(self, event_type: EventType, data: dict) -> JournalEvent:
+        """Create a JournalEvent for the current phase from a prebuilt data dict.
+
+        Specialized _create_event() for the high-frequency task, activity
+        and token_update events: no **kwargs packing and no phase override.
+        """
+        return JournalEvent(_now_iso(), event_type, self._current_phase_name, data)
+
     def start_workflow(self, fresh: bool = False) -> None:
         """Record workflow start event.
 
@@ -255,10 +589,12 @@ class WorkflowJournal:
 
             self._started = True
             now = _now_iso()
+            self._workflow_start_mono = monotonic()
 
             # Clear previous journal if fresh start
             if fresh:
                 self._writer.clear_journal()
+            self._start_writer_thread()
 
             self._summary = WorkflowSummary(
                 feature_name=self.feature_name,
@@ -273,7 +609,8 @@ class WorkflowJournal:
                 phase=None,
                 data={"feature": self.feature_name, "fresh": fresh},
             )
-            self._writer.append_event(event)
+            self._enqueue(event)
+        self._sync()
 
     def end_workflow(self, outcome: str) -> None:
         """Record workflow end event and write summary.
@@ -285,30 +622,30 @@ class WorkflowJournal:
             if not self._started or not self._summary:
                 return
 
+            self._flush_pending_token_event()
+
             now = _now_iso()
             self._summary.ended_at = now
             self._summary.outcome = outcome
 
             # Calculate total duration
-            start_dt = datetime.fromisoformat(self._summary.started_at)
-            end_dt = datetime.fromisoformat(now)
-            self._summary.total_duration_seconds = (end_dt - start_dt).total_seconds()
-
-            # Aggregate totals from phases
-            self._summary.total_cost_usd = sum(p.cost_usd for p in self._summary.phases)
-            self._summary.total_tasks_completed = sum(
-                p.tasks_completed for p in self._summary.phases
-            )
-            self._summary.total_tasks_total = max(
-                (p.tasks_total for p in self._summary.phases), default=0
-            )
-            # Aggregate all unique agents used across all phases
-            all_agents: list[str] = []
+            self._summary.total_duration_seconds = monotonic() - self._workflow_start_mono
+
+            # Aggregate totals and unique agents (in first-use order) in one pass
+            total_cost = 0.0
+            total_completed = 0
+            total_tasks = 0
+            all_agents: dict[str, None] = {}
             for phase in self._summary.phases:
-                for agent in phase.agents_used:
-                    if agent not in all_agents:
-                        all_agents.append(agent)
-            self._summary.all_agents_used = all_agents
+                total_cost += phase.cost_usd
+                total_completed += phase.tasks_completed
+                if phase.tasks_total > total_tasks:
+                    total_tasks = phase.tasks_total
+                all_agents.update(dict.fromkeys(phase.agents_used))
+            self._summary.total_cost_usd = total_cost
+            self._summary.total_tasks_completed = total_completed
+            self._summary.total_tasks_total = total_tasks
+            self._summary.all_agents_used = list(all_agents)
 
             event = JournalEvent(
                 timestamp=now,
@@ -320,8 +657,17 @@ class WorkflowJournal:
                     "total_cost_usd": self._summary.total_cost_usd,
                 },
             )
-            self._writer.append_event(event)
-            self._writer.write_summary(self._summary)
+            self._enqueue(event)
+            writer_thread = self._detach_writer_thread()
+            summary = self._summary
+
+        # File I/O happens outside the lock
+        if writer_thread is not None:
+            writer_thread.join(timeout=JOURNAL_WRITER_JOIN_TIMEOUT_SECONDS)
+        self._writer.flush(fsync=True)
+        self._writer.write_summary(summary)
+        self._writer.close()
+        self._raise_write_error()
 
     def start_phase(
         self,
@@ -342,7 +688,11 @@ class WorkflowJournal:
             if not self._started:
                 return
 
+            self._flush_pending_token_event()
+
             now = _now_iso()
+            self._phase_start_mono = monotonic()
+            self._last_token_flush_mono = 0.0
             self._current_phase_name = phase
             self._current_phase = PhaseSummary(
                 phase_name=phase,
@@ -362,7 +712,8 @@ class WorkflowJournal:
                     "tasks_total": tasks_total,
                 },
             )
-            self._writer.append_event(event)
+            self._enqueue(event)
+        self._sync()
 
     def end_phase(
         self,
@@ -383,6 +734,9 @@ class WorkflowJournal:
             if not self._started or not self._current_phase:
                 return
 
+            # Keep the last known counts before PHASE_END
+            self._flush_pending_token_event()
+
             now = _now_iso()
             phase = self._current_phase
 
@@ -393,9 +747,7 @@ class WorkflowJournal:
             phase.tasks_completed = tasks_completed
 
             # Calculate duration
-            start_dt = datetime.fromisoformat(phase.started_at)
-            end_dt = datetime.fromisoformat(now)
-            phase.duration_seconds = (end_dt - start_dt).total_seconds()
+            phase.duration_seconds = monotonic() - self._phase_start_mono
 
             if self._summary:
                 self._summary.phases.append(phase)
@@ -412,10 +764,12 @@ class WorkflowJournal:
                     "token_usage": token_usage,
                 },
             )
-            self._writer.append_event(event)
+            self._enqueue(event)
 
             self._current_phase = None
             self._current_phase_name = None
+        self._sync()
+        self._writer.flush(fsync=True)
 
     def record_task_event(
         self,
@@ -430,6 +784,8 @@ class WorkflowJournal:
             task_id: ID of the task (e.g., "1.2", "2.3")
             task_name: Optional human-readable name of the task
         """
+        if not self._started:
+            return
         with self._lock:
             if not self._started:
                 return
@@ -438,12 +794,11 @@ class WorkflowJournal:
                 EventType.TASK_START if event_type == "start" else EventType.TASK_COMPLETE
             )
 
-            event = self._create_event(
+            event = self._build_event(
                 journal_event_type,
-                task_id=task_id,
-                task_name=task_name,
+                {"task_id": task_id, "task_name": task_name},
             )
-            self._writer.append_event(event)
+            self._enqueue(event)
 
     def record_activity(self, activity: Activity) -> None:
         """Record a detected activity event.
@@ -451,17 +806,21 @@ class WorkflowJournal:
         Args:
             activity: The Activity object from progress parsing
         """
+        if not self._started:
+            return
         with self._lock:
             if not self._started:
                 return
 
-            event = self._create_event(
+            event = self._build_event(
                 EventType.ACTIVITY,
-                type=activity.type.value,
-                description=activity.description,
-                detail=activity.detail,
+                {
+                    "type": activity.type.value,
+                    "description": activity.description,
+                    "detail": activity.detail,
+                },
             )
-            self._writer.append_event(event)
+            self._enqueue(event)
 
     def record_agent_delegation(
         self,
@@ -479,6 +838,8 @@ class WorkflowJournal:
             to_agent: The agent receiving the delegation
             task_id: Optional task ID associated with the delegation
         """
+        if not self._started:
+            return
         with self._lock:
             if not self._started:
                 return
@@ -490,7 +851,7 @@ class WorkflowJournal:
                 to_agent=to_agent,
                 task_id=task_id,
             )
-            self._writer.append_event(event)
+            self._enqueue(event)
 
             # Track the delegated agent in current phase's agents_used
             if self._current_phase and to_agent:
@@ -500,25 +861,39 @@ class WorkflowJournal:
     def record_token_update(self, usage: TokenUsage, cost: float) -> None:
         """Record a token usage update.
 
+        The phase totals are always updated in memory, but at most one
+        TOKEN_UPDATE event per JOURNAL_TOKEN_UPDATE_INTERVAL_SECONDS is
+        written; the latest skipped update is written at phase end.
+
         Args:
             usage: TokenUsage instance with current counts
             cost: Total cost in USD
         """
+        if not self._started:
+            return
         with self._lock:
             if not self._started:
                 return
 
-            event = self._create_event(
+            event = self._build_event(
                 EventType.TOKEN_UPDATE,
-                input_tokens=usage.input_tokens,
-                output_tokens=usage.output_tokens,
-                cache_read_tokens=usage.cache_read_tokens,
-                cache_creation_tokens=usage.cache_creation_tokens,
-                total_tokens=usage.total_tokens,
-                context_utilization=usage.context_utilization,
-                cost_usd=cost,
+                {
+                    "input_tokens": usage.input_tokens,
+                    "output_tokens": usage.output_tokens,
+                    "cache_read_tokens": usage.cache_read_tokens,
+                    "cache_creation_tokens": usage.cache_creation_tokens,
+                    "total_tokens": usage.total_tokens,
+                    "context_utilization": usage.context_utilization,
+                    "cost_usd": cost,
+                },
             )
-            self._writer.append_event(event)
+            now_mono = monotonic()
+            if now_mono - self._last_token_flush_mono >= JOURNAL_TOKEN_UPDATE_INTERVAL_SECONDS:
+                self._last_token_flush_mono = now_mono
+                self._pending_token_event = None
+                self._enqueue(event)
+            else:
+                self._pending_token_event = event
 
             # Update current phase cost tracking
             if self._current_phase:
@@ -543,6 +918,8 @@ class WorkflowJournal:
             attempts: Number of attempts/warnings before this event
             is_open: Whether the circuit breaker is now open (tripped)
         """
+        if not self._started:
+            return
         with self._lock:
             if not self._started:
                 return
@@ -553,7 +930,8 @@ class WorkflowJournal:
                 attempts=attempts,
                 is_open=is_open,
             )
-            self._writer.append_event(event)
+            self._enqueue(event)
+        self._sync()
 
     def record_validation(
         self,
@@ -568,6 +946,8 @@ class WorkflowJournal:
             approved: Whether the validation was approved
             feedback: Optional feedback from the user
         """
+        if not self._started:
+            return
         with self._lock:
             if not self._started:
                 return
@@ -578,7 +958,8 @@ class WorkflowJournal:
                 approved=approved,
                 feedback=feedback,
             )
-            self._writer.append_event(event)
+            self._enqueue(event)
+        self._sync()
 
     def record_error(self, error_message: str, error_type: str = "unknown") -> None:
         """Record an error event.
@@ -587,6 +968,8 @@ class WorkflowJournal:
             error_message: Description of the error
             error_type: Type of error (e.g., "timeout", "circuit_breaker", "validation")
         """
+        if not self._started:
+            return
         with self._lock:
             if not self._started:
                 return
@@ -596,7 +979,35 @@ class WorkflowJournal:
                 error_type=error_type,
                 message=error_message,
             )
-            self._writer.append_event(event)
+            self._enqueue(event)
+        self._sync()
+
+    def flush(self) -> None:
+        """Write buffered events to the JSONL file.
+
+        Lifecycle events (workflow/phase boundaries, validation, errors,
+        circuit breaker) are written immediately; high-frequency events
+        (tasks, activities, delegations, token updates) are batched.
+        Waits until the writer thread has written everything queued so far.
+        """
+        self._sync()
+
+    def snapshot_last_token_dict(self) -> Optional[dict]:
+        """Return the token counts of the last update in the current phase.
+
+        Returns:
+            Dictionary of token counts, or None if no update was recorded
+            since start_phase().
+        """
+        with self._lock:
+            phase = self._current_phase
+            return phase.token_usage if phase else None
+
+    def last_cost(self) -> float:
+        """Return the cost of the last token update in the current phase."""
+        with self._lock:
+            phase = self._current_phase
+            return phase.cost_usd if phase else 0.0
 
     @property
     def is_started(self) -> bool:
@@ -1,11 +1,14 @@
 """Formatted logging for Ralphy with timestamps and colors."""
 
-from datetime import datetime
+import time
 from typing import Optional
 
 from rich.console import Console
 from rich.text import Text
 
+# (epoch second, "[HH:MM:SS]") of the last formatted timestamp
+_timestamp_cache: tuple[int, str] = (-1, "")
+
 
 class Logger:
     """Formatted logger with timestamps for the terminal."""
@@ -13,24 +16,36 @@ class Logger:
     def __init__(self, console: Optional[Console] = None):
         self.console = console or Console()
         self._live_mode = False
+        # Redirected/piped output has no colors: skip the Rich pipeline
+        self._plain = not self.console.is_terminal
 
     def set_live_mode(self, active: bool) -> None:
         """Enable/disable live mode (skip output for Rich Live)."""
         self._live_mode = active
 
     def _timestamp(self) -> str:
-        """Returns the formatted timestamp [HH:MM:SS]."""
-        return datetime.now().strftime("[%H:%M:%S]")
+        """Returns the formatted timestamp [HH:MM:SS] (formatted once per second)."""
+        global _timestamp_cache
+        second = int(time.time())
+        cached_second, cached = _timestamp_cache
+        if second != cached_second:
+            cached = time.strftime("[%H:%M:%S]", time.localtime(second))
+            _timestamp_cache = (second, cached)
+        return cached
+
+    def _print_line(self, *parts: tuple[str, str]) -> None:
+        """Prints the timestamp followed by the styled parts."""
+        if self._plain:
+            text = "".join(part for part, _ in parts)
+            self.console.file.write(f"{self._timestamp()} {text}\n")
+            return
+        self.console.print(Text.assemble((self._timestamp(), "dim"), " ", *parts))
 
     def _log(self, message: str, style: str = "") -> None:
         """Logs a message with timestamp."""
         if self._live_mode:
             return
-        text = Text()
-        text.append(self._timestamp(), style="dim")
-        text.append(" ")
-        text.append(message, style=style)
-        self.console.print(text)
+        self._print_line((message, style))
 
     def info(self, message: str) -> None:
         """Logs an info message."""
@@ -58,13 +73,7 @@ class Logger:
 
     def validation(self, message: str) -> None:
         """Logs a validation message."""
-        text = Text()
-        text.append(self._timestamp(), style="dim")
-        text.append(" ")
-        text.append("=== ", style="yellow bold")
-        text.append(message, style="yellow bold")
-        text.append(" ===", style="yellow bold")
-        self.console.print(text)
+        self._print_line((f"=== {message} ===", "yellow bold"))
 
     def file_generated(self, filepath: str) -> None:
         """Logs a generated file."""
@@ -72,21 +81,11 @@ class Logger:
 
     def task_start(self, task_description: str) -> None:
         """Logs the start of a task (displayed even in live mode)."""
-        text = Text()
-        text.append(self._timestamp(), style="dim")
-        text.append(" ")
-        text.append("▶ ", style="blue bold")
-        text.append(task_description, style="blue")
-        self.console.print(text)
+        self._print_line(("▶ ", "blue bold"), (task_description, "blue"))
 
     def task_complete(self, task_description: str) -> None:
         """Logs the end of a task (displayed even in live mode)."""
-        text = Text()
-        text.append(self._timestamp(), style="dim")
-        text.append(" ")
-        text.append("✓ ", style="green bold")
-        text.append(task_description, style="green")
-        self.console.print(text)
+        self._print_line(("✓ ", "green bold"), (task_description, "green"))
 
     def stream(self, text: str) -> None:
         """Streams text without newline (for agent output)."""
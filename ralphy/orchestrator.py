@@ -2,27 +2,37 @@
 
 from __future__ import annotations
 
+import os
 import threading
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Optional, Type
+from stat import S_ISREG
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional, Type
 
 from ralphy.agents import DevAgent, PRAgent, QAAgent, SpecAgent
 from ralphy.agents.qa import parse_qa_report_summary
+from ralphy.agents.tasks import count_task_status
 from ralphy.agents.base import AgentResult, BaseAgent
 from ralphy.config import ProjectConfig, ensure_feature_dir, ensure_ralph_dir, load_config
 from ralphy.constants import (
     MIN_QA_REPORT_FILE_SIZE_BYTES,
     MIN_SPEC_FILE_SIZE_BYTES,
     MIN_TASKS_FILE_SIZE_BYTES,
+    RUN_LOCK_FILE,
 )
 from ralphy.journal import WorkflowJournal
 from ralphy.logger import get_logger
 from ralphy.activity import Activity, ActivityType
 from ralphy.progress import ProgressDisplay
-from ralphy.state import PHASE_ORDER, Phase, StateManager
+from ralphy.state import PHASE_INDEX, Phase, StateManager
 from ralphy.validation import HumanValidator
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: no cross-process lock
+    fcntl = None
+
 if TYPE_CHECKING:
     from ralphy.claude import TokenUsage
 
@@ -39,6 +49,28 @@ class TransitionError(WorkflowError):
     pass
 
 
+@dataclass(frozen=True)
+class _PhaseStep:
+    """Une étape du workflow exécutée par Orchestrator.run()."""
+
+    phase: Phase
+    run: Callable[[], bool]
+    failure_outcome: str  # Outcome du journal si run() retourne False
+    skip_message: Optional[str] = None  # Loggé quand l'étape est sautée (reprise)
+    on_skip: Optional[Callable[[], None]] = None
+
+
+# Reprise: dernière phase complétée -> (phase suivante, QA_REPORT.md requis).
+# Les artéfacts de spec sont requis dans tous les cas.
+_RESUME_AFTER: dict[Phase, tuple[Phase, bool]] = {
+    Phase.SPECIFICATION: (Phase.AWAITING_SPEC_VALIDATION, False),
+    Phase.AWAITING_SPEC_VALIDATION: (Phase.IMPLEMENTATION, False),
+    Phase.IMPLEMENTATION: (Phase.QA, False),
+    Phase.QA: (Phase.AWAITING_QA_VALIDATION, True),
+    Phase.AWAITING_QA_VALIDATION: (Phase.PR, True),
+}
+
+
 class Orchestrator:
     """Central coordinator for the Ralphy workflow.
 
@@ -58,6 +90,34 @@ class Orchestrator:
     as a cohesive unit during workflow execution.
     """
 
+    # Attributes read by per-chunk/per-token callbacks live in slots; __dict__
+    # is kept for the cached_property helpers (validator, journal, display)
+    __slots__ = (
+        "project_path",
+        "feature_name",
+        "feature_dir",
+        "_prd_path",
+        "_spec_path",
+        "_tasks_path",
+        "_qa_report_path",
+        "config",
+        "state_manager",
+        "logger",
+        "_aborted",
+        "_show_progress",
+        "_current_phase_model",
+        "_current_phase_timeout",
+        "_current_phase_tasks_total",
+        "_task_poll_wake",
+        "_run_lock",
+        "_qa_summary_cache",
+        "_stat_cache",
+        "on_output",
+        "_common_agent_kwargs",
+        "_resume_state_mtime_ns",
+        "__dict__",
+    )
+
     def __init__(
         self,
         project_path: Path,
@@ -65,67 +125,117 @@ class Orchestrator:
         on_output: Optional[Callable[[str], None]] = None,
         show_progress: bool = True,
     ):
-        self.project_path = project_path.resolve()
+        # Lexical normalization only; StateManager resolves symlinks itself
+        # for its path-safety checks
+        self.project_path = Path(os.path.abspath(project_path))
         self.feature_name = feature_name
         self.feature_dir = project_path / "docs" / "features" / feature_name
-        self._user_output = on_output
+        self._prd_path = self.feature_dir / "PRD.md"
+        self._spec_path = self.feature_dir / "SPEC.md"
+        self._tasks_path = self.feature_dir / "TASKS.md"
+        self._qa_report_path = self.feature_dir / "QA_REPORT.md"
         self.config = load_config(self.project_path)
         self.state_manager = StateManager(self.project_path, feature_name)
-        self.validator = HumanValidator()
         self.logger = get_logger()
         self._aborted = False
         self._show_progress = show_progress
-        self._progress_display: Optional[ProgressDisplay] = None
-
-        # Workflow journal for progress persistence
-        self._journal = WorkflowJournal(self.feature_dir, feature_name)
 
         # Track current phase for journal end_phase calls
         self._current_phase_model: str = ""
         self._current_phase_timeout: int = 0
         self._current_phase_tasks_total: int = 0
-        self._last_token_usage: Optional[TokenUsage] = None
-        self._last_cost: float = 0.0
 
-        # Cached DevAgent for query operations (count_task_status, get_next_pending_task_after)
-        self._cached_dev_agent: Optional[DevAgent] = None
+        # Set on task completion to wake the TASKS.md polling thread early
+        self._task_poll_wake: Optional[threading.Event] = None
+
+        # Handle holding the cross-process run lock while run() executes
+        self._run_lock: Optional[IO[str]] = None
+
+        # ((mtime_ns, size), summary) of the last parsed QA_REPORT.md
+        self._qa_summary_cache: Optional[tuple[tuple[int, int], dict]] = None
+
+        # (exists, size) of artifacts, cleared at run start and after each agent phase
+        self._stat_cache: dict[Path, tuple[bool, int]] = {}
+        # state.json mtime of the failed run being resumed (see _plan_run)
+        self._resume_state_mtime_ns: Optional[int] = None
 
         # Configure output callback
         if show_progress:
-            self._progress_display = ProgressDisplay(
-                on_task_event=self._on_task_event,
-                on_activity=self._on_activity,
-            )
-            self.on_output = self._progress_output
+            self.on_output = self._bind_progress_output(on_output)
         else:
             self.on_output = on_output or self._default_output
 
+        # Constructor kwargs shared by every phase agent
+        self._common_agent_kwargs: dict[str, Any] = {
+            "project_path": self.project_path,
+            "config": self.config,
+            "on_output": self.on_output,
+            "feature_dir": self.feature_dir,
+            "on_token_update": self._on_token_update,
+        }
+
+    # Validator, journal and progress display are built on first use: short-lived
+    # invocations (failed prerequisites, lock held elsewhere) never pay for them.
+
+    @cached_property
+    def validator(self) -> HumanValidator:
+        """Human validation gates (built on first validation)."""
+        return HumanValidator()
+
+    @cached_property
+    def _journal(self) -> WorkflowJournal:
+        """Workflow journal for progress persistence (built when run() starts)."""
+        return WorkflowJournal(self.feature_dir, self.feature_name)
+
+    @cached_property
+    def _progress_display(self) -> Optional[ProgressDisplay]:
+        """Rich progress display, or None when progress is disabled."""
+        if not self._show_progress:
+            return None
+        return ProgressDisplay(
+            on_task_event=self._on_task_event,
+            on_activity=self._on_activity,
+        )
+
     def _default_output(self, text: str) -> None:
         """Default output handler."""
         self.logger.stream(text)
 
-    @property
+    @cached_property
     def _dev_agent_for_queries(self) -> DevAgent:
         """Lazily create and cache DevAgent for query operations.
 
-        This agent is reused for count_task_status() and get_next_pending_task_after()
-        to avoid repeated instantiation. For run() operations, create fresh instances
-        with appropriate callbacks.
+        This agent is reused for get_next_pending_task_after() on resume to
+        avoid repeated instantiation. For run() operations, create fresh
+        instances with appropriate callbacks.
         """
-        if self._cached_dev_agent is None:
-            self._cached_dev_agent = DevAgent(
-                project_path=self.project_path,
-                config=self.config,
-                feature_dir=self.feature_dir,
-            )
-        return self._cached_dev_agent
+        return DevAgent(
+            project_path=self.project_path,
+            config=self.config,
+            feature_dir=self.feature_dir,
+        )
 
-    def _progress_output(self, text: str) -> None:
-        """Handler de sortie avec mise à jour du progress display."""
-        if self._progress_display and self._progress_display.is_active:
-            self._progress_display.process_output(text)
-        if self._user_output:
-            self._user_output(text)
+    def _bind_progress_output(
+        self, user_output: Optional[Callable[[str], None]]
+    ) -> Callable[[str], None]:
+        """Construit le handler de sortie avec mise à jour du progress display.
+
+        Appelé pour chaque chunk streamé: le display (construit paresseusement)
+        est résolu au premier appel puis gardé dans la closure, comme le
+        callback utilisateur.
+        """
+        display: Optional[ProgressDisplay] = None
+
+        def progress_output(text: str) -> None:
+            nonlocal display
+            if display is None:
+                display = self._progress_display
+            if display.is_active:
+                display.process_output(text)
+            if user_output is not None:
+                user_output(text)
+
+        return progress_output
 
     def _on_task_event(
         self, event_type: str, task_id: str | None, task_name: str | None
@@ -151,6 +261,9 @@ class Orchestrator:
             # Checkpoint task as completed - let polling thread handle state.json updates
             if task_id:
                 self.state_manager.checkpoint_task(task_id, "completed")
+            # Recount off the output path: wake the poller instead of parsing TASKS.md here
+            if self._task_poll_wake is not None:
+                self._task_poll_wake.set()
             # Log to journal
             self._journal.record_task_event(event_type, task_id, task_name)
 
@@ -179,10 +292,7 @@ class Orchestrator:
         """Callback appelé lors de la mise à jour des tokens."""
         if self._progress_display and self._progress_display.is_active:
             self._progress_display.update_token_usage(usage, cost)
-        # Track for phase end summary
-        self._last_token_usage = usage
-        self._last_cost = cost
-        # Log to journal
+        # Log to journal (which also keeps the last counts for end_phase)
         self._journal.record_token_update(usage, cost)
 
     def _start_task_polling(self) -> threading.Event:
@@ -196,31 +306,47 @@ class Orchestrator:
 
         The polling thread is the primary source for state.json updates,
         ensuring the file-based count (authoritative) is always persisted.
+        It wakes up early when a task completion is detected, and only
+        re-parses TASKS.md when its mtime or size changed.
 
         Returns:
             Event to signal the polling thread to stop.
         """
         stop_event = threading.Event()
+        wake_event = threading.Event()
+        self._task_poll_wake = wake_event
+        tasks_path = self._tasks_path
         last_completed = -1
+        last_signature: Optional[tuple[int, int]] = None
 
         def poll_loop() -> None:
-            nonlocal last_completed
+            nonlocal last_completed, last_signature
             while not stop_event.is_set():
                 try:
-                    completed, total = self._dev_agent_for_queries.count_task_status()
-                    # Always sync state.json with file-based count (authoritative source)
-                    if total > 0:
-                        self.state_manager.update_tasks(completed, total)
-                    # Only update progress display when count changes (avoid UI churn)
-                    if completed != last_completed and total > 0:
-                        last_completed = completed
-                        if self._progress_display and self._progress_display.is_active:
-                            # Use from_thread=True to skip _refresh() - Rich Live auto-refresh will pick up changes
-                            self._progress_display.update_tasks(completed, total, from_thread=True)
+                    try:
+                        st = tasks_path.stat()
+                        signature: Optional[tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+                    except FileNotFoundError:
+                        signature = None
+                    # Unchanged TASKS.md: counts and state.json are already up to date
+                    if signature is None or signature != last_signature:
+                        last_signature = signature
+                        completed, total = count_task_status(tasks_path)
+                        # Always sync state.json with file-based count (authoritative source)
+                        if total > 0:
+                            self.state_manager.update_tasks(completed, total)
+                        # Only update progress display when count changes (avoid UI churn)
+                        if completed != last_completed and total > 0:
+                            last_completed = completed
+                            if self._progress_display and self._progress_display.is_active:
+                                # Use from_thread=True to skip _refresh() - Rich Live auto-refresh will pick up changes
+                                self._progress_display.update_tasks(completed, total, from_thread=True)
                 except Exception as e:
                     # Log polling errors for debugging but don't crash
                     self.logger.debug(f"Task polling error: {e}")
-                stop_event.wait(timeout=1.0)  # Poll every second for faster updates
+                # Poll every second, or sooner when a task completes
+                wake_event.wait(timeout=1.0)
+                wake_event.clear()
 
         thread = threading.Thread(target=poll_loop, daemon=True, name="task-poller")
         thread.start()
@@ -229,6 +355,27 @@ class Orchestrator:
     def _stop_task_polling(self, stop_event: threading.Event) -> None:
         """Signal the task polling thread to stop."""
         stop_event.set()
+        if self._task_poll_wake is not None:
+            self._task_poll_wake.set()
+            self._task_poll_wake = None
+
+    def _cached_stat(self, path: Path) -> tuple[bool, int]:
+        """Returns (exists, size) for an artifact, with one stat() per path.
+
+        Anything but a regular file (e.g. a directory) counts as missing.
+        Artifacts only change while an agent runs, so the cache is cleared
+        at the start of run() and after each agent phase.
+        """
+        cached = self._stat_cache.get(path)
+        if cached is None:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                cached = (False, 0)
+            else:
+                cached = (True, st.st_size) if S_ISREG(st.st_mode) else (False, 0)
+            self._stat_cache[path] = cached
+        return cached
 
     def _spec_artifacts_valid(self) -> bool:
         """Vérifie si les artéfacts de la phase SPECIFICATION sont valides.
@@ -236,13 +383,13 @@ class Orchestrator:
         Vérifie que SPEC.md et TASKS.md existent et ont une taille minimale
         indiquant un contenu substantiel.
         """
-        spec_path = self.feature_dir / "SPEC.md"
-        tasks_path = self.feature_dir / "TASKS.md"
+        spec_exists, spec_size = self._cached_stat(self._spec_path)
+        tasks_exists, tasks_size = self._cached_stat(self._tasks_path)
         return (
-            spec_path.exists()
-            and tasks_path.exists()
-            and spec_path.stat().st_size > MIN_SPEC_FILE_SIZE_BYTES
-            and tasks_path.stat().st_size > MIN_TASKS_FILE_SIZE_BYTES
+            spec_exists
+            and tasks_exists
+            and spec_size > MIN_SPEC_FILE_SIZE_BYTES
+            and tasks_size > MIN_TASKS_FILE_SIZE_BYTES
         )
 
     def _qa_artifacts_valid(self) -> bool:
@@ -250,21 +397,33 @@ class Orchestrator:
 
         Vérifie que QA_REPORT.md existe et a une taille minimale.
         """
-        qa_path = self.feature_dir / "QA_REPORT.md"
-        return qa_path.exists() and qa_path.stat().st_size > MIN_QA_REPORT_FILE_SIZE_BYTES
+        qa_exists, qa_size = self._cached_stat(self._qa_report_path)
+        return qa_exists and qa_size > MIN_QA_REPORT_FILE_SIZE_BYTES
 
     def _get_qa_report_summary(self) -> dict:
         """Extract QA summary directly from QA_REPORT.md file.
 
         This decouples the validation phase from the QAAgent instance,
         allowing workflow resume from AWAITING_QA_VALIDATION phase.
+
+        The parser needs the whole report (it counts critical issues), so
+        the file is read in full, but only when its mtime or size changed
+        since the previous call.
         """
-        qa_path = self.feature_dir / "QA_REPORT.md"
-        if not qa_path.exists():
+        qa_path = self._qa_report_path
+        try:
+            st = qa_path.stat()
+        except FileNotFoundError:
             return parse_qa_report_summary(None)
 
+        signature = (st.st_mtime_ns, st.st_size)
+        if self._qa_summary_cache is not None and self._qa_summary_cache[0] == signature:
+            return self._qa_summary_cache[1]
+
         content = qa_path.read_text(encoding="utf-8")
-        return parse_qa_report_summary(content)
+        summary = parse_qa_report_summary(content)
+        self._qa_summary_cache = (signature, summary)
+        return summary
 
     def _determine_resume_phase(self) -> Optional[Phase]:
         """Détermine la phase depuis laquelle reprendre le workflow.
@@ -283,23 +442,16 @@ class Orchestrator:
 
         # Détermine la prochaine phase basée sur ce qui a été complété
         # et valide que les artéfacts requis sont présents
-        if completed_phase == Phase.SPECIFICATION:
-            if self._spec_artifacts_valid():
-                return Phase.AWAITING_SPEC_VALIDATION
-        elif completed_phase == Phase.AWAITING_SPEC_VALIDATION:
-            if self._spec_artifacts_valid():
-                return Phase.IMPLEMENTATION
-        elif completed_phase == Phase.IMPLEMENTATION:
-            if self._spec_artifacts_valid():
-                return Phase.QA
-        elif completed_phase == Phase.QA:
-            if self._spec_artifacts_valid() and self._qa_artifacts_valid():
-                return Phase.AWAITING_QA_VALIDATION
-        elif completed_phase == Phase.AWAITING_QA_VALIDATION:
-            if self._spec_artifacts_valid() and self._qa_artifacts_valid():
-                return Phase.PR
-
-        return None
+        resume = _RESUME_AFTER.get(completed_phase)
+        if resume is None:
+            return None
+
+        next_phase, needs_qa = resume
+        if not self._spec_artifacts_valid():
+            return None
+        if needs_qa and not self._qa_artifacts_valid():
+            return None
+        return next_phase
 
     def _should_skip_phase(self, phase: Phase, resume_from: Optional[Phase]) -> bool:
         """Détermine si une phase doit être sautée lors de la reprise.
@@ -314,21 +466,35 @@ class Orchestrator:
         if not resume_from:
             return False
 
-        try:
-            phase_idx = PHASE_ORDER.index(phase)
-            resume_idx = PHASE_ORDER.index(resume_from)
-            return phase_idx < resume_idx
-        except ValueError:
+        phase_idx = PHASE_INDEX.get(phase)
+        resume_idx = PHASE_INDEX.get(resume_from)
+        if phase_idx is None or resume_idx is None:
             return False
+        return phase_idx < resume_idx
 
     def _restore_task_count(self) -> None:
         """Restaure le compteur de tâches depuis TASKS.md lors d'une reprise.
 
         Utilisé quand on saute la phase SPECIFICATION pour restaurer
         le nombre de tâches complétées et le total dans l'état.
-        Parse TASKS.md pour compter les tâches marquées comme 'completed'.
+        Les compteurs déjà persistés sont gardés tant que TASKS.md n'a pas
+        été modifié après le dernier state.json du run en échec; sinon
+        TASKS.md est re-parsé.
         """
-        completed, total = self._dev_agent_for_queries.count_task_status()
+        if self.state_manager.state.tasks_total > 0:
+            try:
+                tasks_mtime = self._tasks_path.stat().st_mtime_ns
+                # The IDLE transition of _plan_run has rewritten state.json
+                state_mtime = self._resume_state_mtime_ns
+                if state_mtime is None:
+                    state_mtime = self.state_manager.state_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                pass
+            else:
+                if tasks_mtime <= state_mtime:
+                    return
+
+        completed, total = count_task_status(self._tasks_path)
         if total > 0:
             self.state_manager.update_tasks(completed, total)
 
@@ -345,8 +511,6 @@ class Orchestrator:
         self._current_phase_model = model
         self._current_phase_timeout = timeout
         self._current_phase_tasks_total = total_tasks
-        self._last_token_usage = None
-        self._last_cost = 0.0
 
         # Log to journal
         self._journal.start_phase(
@@ -379,18 +543,10 @@ class Orchestrator:
             tasks_completed: Number of tasks completed in this phase
         """
         # Log phase end to journal
-        token_usage_dict = None
-        if self._last_token_usage:
-            token_usage_dict = {
-                "input_tokens": self._last_token_usage.input_tokens,
-                "output_tokens": self._last_token_usage.output_tokens,
-                "cache_read_tokens": self._last_token_usage.cache_read_tokens,
-                "cache_creation_tokens": self._last_token_usage.cache_creation_tokens,
-            }
         self._journal.end_phase(
             outcome=outcome,
-            token_usage=token_usage_dict,
-            cost=self._last_cost,
+            token_usage=self._journal.snapshot_last_token_dict(),
+            cost=self._journal.last_cost(),
             tasks_completed=tasks_completed,
         )
 
@@ -398,13 +554,49 @@ class Orchestrator:
             self._progress_display.stop()
             self.logger.set_live_mode(False)
 
+    def _acquire_run_lock(self) -> bool:
+        """Prend un verrou exclusif (flock) sur la feature pour la durée de run().
+
+        Sérialise les orchestrateurs de plusieurs processus sur le même
+        feature_dir ; is_running() ne voit que l'état déjà sauvegardé.
+
+        Returns:
+            False si un autre processus détient déjà le verrou.
+        """
+        if fcntl is None or not self.feature_dir.is_dir():
+            # No flock on this platform / no feature: prerequisites will fail anyway
+            return True
+        lock_path = self.feature_dir / ".ralphy" / RUN_LOCK_FILE
+        lock_path.parent.mkdir(exist_ok=True)
+        lock_file = open(lock_path, "a")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+        self._run_lock = lock_file
+        return True
+
+    def _release_run_lock(self) -> None:
+        """Libère le verrou pris par _acquire_run_lock()."""
+        if self._run_lock is not None:
+            fcntl.flock(self._run_lock.fileno(), fcntl.LOCK_UN)
+            self._run_lock.close()
+            self._run_lock = None
+
     def run(self, fresh: bool = False) -> bool:
         """Exécute le workflow complet.
 
         Args:
             fresh: Si True, force un redémarrage complet sans reprise.
         """
+        # Another process runs this feature: leave its state and journal untouched
+        if not self._acquire_run_lock():
+            self.logger.error("Un workflow est déjà en cours (lock)")
+            return False
+
         workflow_outcome = "unknown"
+        self._stat_cache.clear()
         try:
             # Start journal at workflow begin
             self._journal.start_workflow(fresh=fresh)
@@ -413,74 +605,8 @@ class Orchestrator:
             ensure_ralph_dir(self.project_path)
             ensure_feature_dir(self.project_path, self.feature_name)
 
-            # Détermine si on peut reprendre depuis une phase précédente
-            resume_phase = None
-            if self.state_manager.state.phase in (Phase.FAILED, Phase.REJECTED):
-                if not fresh:
-                    resume_phase = self._determine_resume_phase()
-                    if resume_phase:
-                        self.logger.info(
-                            f"Reprise du workflow depuis: {resume_phase.value}"
-                        )
-                self._safe_transition(Phase.IDLE)
-
-            # Phase 1: Specification
-            if not self._should_skip_phase(Phase.SPECIFICATION, resume_phase):
-                if not self._run_specification_phase():
-                    workflow_outcome = "failed"
-                    return False
-                self.state_manager.mark_phase_completed(Phase.SPECIFICATION)
-            else:
-                self.logger.info("Phase SPECIFICATION déjà complétée, passage à la suite")
-                self._restore_task_count()
-
-            # Validation #1
-            if not self._should_skip_phase(Phase.AWAITING_SPEC_VALIDATION, resume_phase):
-                if not self._run_spec_validation():
-                    workflow_outcome = "rejected"
-                    return False
-                self.state_manager.mark_phase_completed(Phase.AWAITING_SPEC_VALIDATION)
-            else:
-                self.logger.info("Validation SPEC déjà effectuée, passage à la suite")
-
-            # Phase 2: Implementation
-            if not self._should_skip_phase(Phase.IMPLEMENTATION, resume_phase):
-                if not self._run_implementation_phase():
-                    workflow_outcome = "failed"
-                    return False
-                self.state_manager.mark_phase_completed(Phase.IMPLEMENTATION)
-            else:
-                self.logger.info("Phase IMPLEMENTATION déjà complétée, passage à la suite")
-
-            # Phase 3: QA
-            if not self._should_skip_phase(Phase.QA, resume_phase):
-                if not self._run_qa_phase():
-                    workflow_outcome = "failed"
-                    return False
-                self.state_manager.mark_phase_completed(Phase.QA)
-            else:
-                self.logger.info("Phase QA déjà complétée, passage à la suite")
-
-            # Validation #2
-            if not self._should_skip_phase(Phase.AWAITING_QA_VALIDATION, resume_phase):
-                if not self._run_qa_validation():
-                    workflow_outcome = "rejected"
-                    return False
-                self.state_manager.mark_phase_completed(Phase.AWAITING_QA_VALIDATION)
-            else:
-                self.logger.info("Validation QA déjà effectuée, passage à la suite")
-
-            # Phase 4: PR
-            if not self._should_skip_phase(Phase.PR, resume_phase):
-                if not self._run_pr_phase():
-                    workflow_outcome = "failed"
-                    return False
-                self.state_manager.mark_phase_completed(Phase.PR)
-
-            self._safe_transition(Phase.COMPLETED)
-            self.logger.success("Workflow terminé avec succès!")
-            workflow_outcome = "completed"
-            return True
+            workflow_outcome = self._execute_plan(self._plan_run(fresh))
+            return workflow_outcome == "completed"
 
         except WorkflowError as e:
             self.state_manager.set_failed(str(e))
@@ -496,6 +622,114 @@ class Orchestrator:
         finally:
             # End journal with final outcome
             self._journal.end_workflow(workflow_outcome)
+            self._release_run_lock()
+            # Artifact stats are only valid for this run
+            self._stat_cache.clear()
+
+    def _plan_run(self, fresh: bool) -> list[_PhaseStep]:
+        """Décide de la reprise et retourne les étapes à exécuter.
+
+        Un workflow en échec ou rejeté repart de IDLE, depuis la phase de
+        reprise si ses artéfacts le permettent (sauf `fresh`). Les étapes
+        antérieures sont sautées ici: leur message est loggé et leur hook
+        on_skip exécuté.
+
+        Args:
+            fresh: Si True, force un redémarrage complet sans reprise.
+
+        Returns:
+            Les étapes restantes, dans l'ordre d'exécution.
+        """
+        # Détermine si on peut reprendre depuis une phase précédente
+        resume_phase = None
+        if self.state_manager.state.phase in (Phase.FAILED, Phase.REJECTED):
+            # Captured before the IDLE transition rewrites state.json, for
+            # the TASKS.md freshness check of _restore_task_count
+            try:
+                self._resume_state_mtime_ns = self.state_manager.state_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._resume_state_mtime_ns = None
+            if not fresh:
+                resume_phase = self._determine_resume_phase()
+                if resume_phase:
+                    self.logger.info(f"Reprise du workflow depuis: {resume_phase.value}")
+            self._safe_transition(Phase.IDLE)
+
+        # Fresh start (or nothing to resume): every step runs
+        skip_until = PHASE_INDEX.get(resume_phase, -1) if resume_phase else -1
+        if skip_until < 0:
+            return self._phase_steps()
+
+        # Steps before the resume point are skipped. The steps follow
+        # PHASE_ORDER, so a step's position is its index.
+        plan = []
+        for index, step in enumerate(self._phase_steps()):
+            if index < skip_until:
+                if step.skip_message:
+                    self.logger.info(step.skip_message)
+                if step.on_skip:
+                    step.on_skip()
+            else:
+                plan.append(step)
+        return plan
+
+    def _execute_plan(self, plan: list[_PhaseStep]) -> str:
+        """Exécute les étapes planifiées puis termine le workflow.
+
+        Returns:
+            "completed", ou l'outcome d'échec de la première étape qui échoue.
+        """
+        for step in plan:
+            if not step.run():
+                return step.failure_outcome
+            self.state_manager.mark_phase_completed(step.phase)
+
+        self._safe_transition(Phase.COMPLETED)
+        self.logger.success("Workflow terminé avec succès!")
+        return "completed"
+
+    def _phase_steps(self) -> list[_PhaseStep]:
+        """Retourne les étapes du workflow, dans l'ordre de PHASE_ORDER."""
+        return [
+            # Phase 1: Specification
+            _PhaseStep(
+                Phase.SPECIFICATION,
+                self._run_specification_phase,
+                "failed",
+                "Phase SPECIFICATION déjà complétée, passage à la suite",
+                on_skip=self._restore_task_count,
+            ),
+            # Validation #1
+            _PhaseStep(
+                Phase.AWAITING_SPEC_VALIDATION,
+                self._run_spec_validation,
+                "rejected",
+                "Validation SPEC déjà effectuée, passage à la suite",
+            ),
+            # Phase 2: Implementation
+            _PhaseStep(
+                Phase.IMPLEMENTATION,
+                self._run_implementation_phase,
+                "failed",
+                "Phase IMPLEMENTATION déjà complétée, passage à la suite",
+            ),
+            # Phase 3: QA
+            _PhaseStep(
+                Phase.QA,
+                self._run_qa_phase,
+                "failed",
+                "Phase QA déjà complétée, passage à la suite",
+            ),
+            # Validation #2
+            _PhaseStep(
+                Phase.AWAITING_QA_VALIDATION,
+                self._run_qa_validation,
+                "rejected",
+                "Validation QA déjà effectuée, passage à la suite",
+            ),
+            # Phase 4: PR
+            _PhaseStep(Phase.PR, self._run_pr_phase, "failed"),
+        ]
 
     def abort(self) -> None:
         """Abort le workflow en cours."""
@@ -516,8 +750,8 @@ class Orchestrator:
 
     def _validate_prerequisites(self) -> None:
         """Vérifie les prérequis."""
-        prd_path = self.feature_dir / "PRD.md"
-        if not prd_path.exists():
+        prd_exists, _ = self._cached_stat(self._prd_path)
+        if not prd_exists:
             raise WorkflowError(f"PRD.md non trouvé dans {self.feature_dir}")
 
         # Vérifie que le projet n'est pas déjà en cours
@@ -595,62 +829,57 @@ class Orchestrator:
         if pre_start:
             pre_start()
 
-        phase_outcome = "unknown"
-        tasks_completed = 0
-        try:
-            # Build agent with common + custom kwargs
-            kwargs: dict[str, Any] = {
-                "project_path": self.project_path,
-                "config": self.config,
-                "on_output": self.on_output,
-                "model": model,
-                "feature_dir": self.feature_dir,
-                "on_token_update": self._on_token_update,
-            }
-            if agent_kwargs:
-                kwargs.update(agent_kwargs)
-
-            agent = agent_class(**kwargs)
-
-            # Update progress display with discovered agents for DevAgent
-            if (
-                self._progress_display
-                and self._progress_display.is_active
-                and hasattr(agent, "_discover_agents")
-            ):
-                discovered = agent._discover_agents()
-                if discovered:
-                    self._progress_display.update_available_agents(
-                        [a["name"] for a in discovered]
+        # Task checkpoints written during the phase are coalesced; any other
+        # state change (failure, abort) still reaches state.json immediately
+        with self.state_manager.batch():
+            phase_outcome = "unknown"
+            tasks_completed = 0
+            try:
+                # Build agent with common + custom kwargs (custom ones win)
+                if agent_kwargs:
+                    agent = agent_class(
+                        **{**self._common_agent_kwargs, "model": model, **agent_kwargs}
                     )
+                else:
+                    agent = agent_class(**self._common_agent_kwargs, model=model)
+
+                # Update progress display with discovered agents for DevAgent
+                if (
+                    isinstance(agent, DevAgent)
+                    and self._progress_display
+                    and self._progress_display.is_active
+                ):
+                    discovered = agent._discover_agents()
+                    if discovered:
+                        self._progress_display.update_available_agents(
+                            [a["name"] for a in discovered]
+                        )
 
-            # Run agent with timeout + custom kwargs
-            run_args: dict[str, Any] = {"timeout": timeout}
-            if run_kwargs:
-                run_args.update(run_kwargs)
-
-            result = agent.run(**run_args)
+                # Run agent with timeout + custom kwargs
+                result = agent.run(timeout=timeout, **(run_kwargs or {}))
 
-            if self._aborted:
-                phase_outcome = "aborted"
-                tasks_completed = self.state_manager.state.tasks_completed
-                return False
+                if self._aborted:
+                    phase_outcome = "aborted"
+                    tasks_completed = self.state_manager.state.tasks_completed
+                    return False
 
-            if not result.success:
-                self.state_manager.set_failed(result.error_message)
-                phase_outcome = "failed"
-                tasks_completed = self.state_manager.state.tasks_completed
-                return False
+                if not result.success:
+                    self.state_manager.set_failed(result.error_message)
+                    phase_outcome = "failed"
+                    tasks_completed = self.state_manager.state.tasks_completed
+                    return False
 
-            # Optional post-run callback
-            if post_run:
-                post_run(result, agent)
+                # Optional post-run callback
+                if post_run:
+                    post_run(result, agent)
 
-            phase_outcome = "success"
-            tasks_completed = self.state_manager.state.tasks_completed
-            return True
-        finally:
-            self._stop_phase_progress(outcome=phase_outcome, tasks_completed=tasks_completed)
+                phase_outcome = "success"
+                tasks_completed = self.state_manager.state.tasks_completed
+                return True
+            finally:
+                # The agent may have written artifacts
+                self._stat_cache.clear()
+                self._stop_phase_progress(outcome=phase_outcome, tasks_completed=tasks_completed)
 
     def _run_specification_phase(self) -> bool:
         """Exécute la phase de spécification."""
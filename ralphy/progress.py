@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Callable, Optional
@@ -21,11 +23,45 @@ from ralphy.activity import (
     match_agent_name,
     normalize_agent_name,
 )
+from ralphy.constants import PROGRESS_SCAN_WINDOW_CHARS
 
 if TYPE_CHECKING:
     from ralphy.claude import TokenUsage
 
 
+def _scan_start(text: str) -> int:
+    """Returns the offset of the tail of text scanned for activity.
+
+    In long output chunks, the activity types other than task markers
+    are only searched in the last PROGRESS_SCAN_WINDOW_CHARS characters,
+    starting at a line boundary when there is one, so that regex work
+    stays bounded.
+    """
+    cut = len(text) - PROGRESS_SCAN_WINDOW_CHARS
+    if cut <= 0:
+        return 0
+    line_start = text.find("\n", cut)
+    return line_start + 1 if line_start != -1 else cut
+
+
+def _tail_lines(text: str, count: int) -> list[str]:
+    """Returns the last `count` stripped lines of text longer than 2 chars.
+
+    Walks back from the end of text, so a long chunk costs the same as
+    its last few lines instead of a split of the whole chunk.
+    """
+    lines: list[str] = []
+    end = len(text)
+    while end >= 0 and len(lines) < count:
+        start = text.rfind("\n", 0, end) + 1
+        line = text[start:end].strip()
+        if len(line) > 2:
+            lines.append(line)
+        end = start - 1
+    lines.reverse()
+    return lines
+
+
 @dataclass
 class ProgressState:
     """Progress state."""
@@ -37,10 +73,13 @@ class ProgressState:
     current_activity: Optional[Activity] = None
     current_task_id: Optional[str] = None  # E.g., "1.9"
     current_task_name: Optional[str] = None  # E.g., "Model - Create Team model"
-    last_output_lines: list[str] = field(default_factory=list)
+    last_output_lines: deque[str] = field(
+        default_factory=lambda: deque(maxlen=ProgressDisplay.MAX_OUTPUT_LINES)
+    )
     # New fields for enriched display
     model_name: str = ""
     phase_started_at: Optional[datetime] = None
+    phase_started_monotonic: Optional[float] = None  # time.monotonic() at start, for elapsed
     phase_timeout: int = 0  # seconds
     feature_name: str = ""
     # Token usage tracking
@@ -140,7 +179,10 @@ class ProgressRenderer:
 
         # Elapsed time and timeout line
         if state.phase_started_at:
-            elapsed = (datetime.now() - state.phase_started_at).total_seconds()
+            if state.phase_started_monotonic is not None:
+                elapsed = time.monotonic() - state.phase_started_monotonic
+            else:
+                elapsed = (datetime.now() - state.phase_started_at).total_seconds()
             time_line = Text()
             time_line.append("Elapsed: ", style="dim")
             time_line.append(self.format_elapsed(elapsed), style="bold green")
@@ -212,7 +254,7 @@ class ProgressRenderer:
         # Last output lines (reduced prominence)
         if state.last_output_lines:
             output_text = Text()
-            for line in state.last_output_lines[-self.MAX_OUTPUT_LINES:]:
+            for line in state.last_output_lines:
                 display_line = line
                 output_text.append("  > ", style="dim")
                 output_text.append(display_line + "\n", style="dim")
@@ -275,6 +317,7 @@ class ProgressDisplay:
                 tasks_total=total_tasks,
                 model_name=model,
                 phase_started_at=datetime.now(),
+                phase_started_monotonic=time.monotonic(),
                 phase_timeout=timeout,
                 feature_name=feature_name,
                 agent_name=agent_name,
@@ -283,21 +326,26 @@ class ProgressDisplay:
                 detected_task_ids=set(),
             )
 
-            # Reset progress bars
-            self._phase_progress = Progress(
-                SpinnerColumn(),
-                TextColumn("[bold cyan]{task.description}"),
-                BarColumn(bar_width=30),
-                TaskProgressColumn(),
-                console=self.console,
-            )
-            self._tasks_progress = Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]{task.description}"),
-                BarColumn(bar_width=30),
-                TextColumn("[progress.percentage]{task.completed}/{task.total} completed"),
-                console=self.console,
-            )
+            # Reset progress bars (created on the first start, then reused)
+            if self._phase_progress is None:
+                self._phase_progress = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bold cyan]{task.description}"),
+                    BarColumn(bar_width=30),
+                    TaskProgressColumn(),
+                    console=self.console,
+                )
+                self._tasks_progress = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bold blue]{task.description}"),
+                    BarColumn(bar_width=30),
+                    TextColumn("[progress.percentage]{task.completed}/{task.total} completed"),
+                    console=self.console,
+                )
+            else:
+                for progress in (self._phase_progress, self._tasks_progress):
+                    for task_id in progress.task_ids:
+                        progress.remove_task(task_id)
 
             self._phase_task_id = self._phase_progress.add_task(
                 phase_name.upper(), total=100, completed=0
@@ -391,8 +439,9 @@ class ProgressDisplay:
     def process_output(self, text: str) -> None:
         """Processes output and updates display."""
         with self._lock:
-            # Detects activity
-            activity = self._parser.parse(text)
+            # Detects activity (task markers in the whole chunk, the rest
+            # on the tail of long chunks)
+            activity = self._parser.parse(text, _scan_start(text))
             if activity:
                 self._state.current_activity = activity
 
@@ -494,13 +543,7 @@ class ProgressDisplay:
                                 self._state.agent_name = final_agent
 
             # Keeps last output lines
-            lines = text.strip().split("\n")
-            for line in lines:
-                line = line.strip()
-                if line and len(line) > 2:
-                    self._state.last_output_lines.append(line)
-                    if len(self._state.last_output_lines) > self.MAX_OUTPUT_LINES:
-                        self._state.last_output_lines.pop(0)
+            self._state.last_output_lines.extend(_tail_lines(text, self.MAX_OUTPUT_LINES))
 
             self._refresh()
 
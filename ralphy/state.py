@@ -3,13 +3,19 @@
 import json
 import os
 import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from time import monotonic
+from typing import Iterator, Optional
 
-from ralphy.constants import validate_feature_name
+from ralphy.constants import (
+    STATE_BATCH_MAX_DELAY_SECONDS,
+    STATE_BATCH_MAX_WRITES,
+    validate_feature_name,
+)
 
 
 class Phase(str, Enum):
@@ -47,6 +53,32 @@ PHASE_ORDER: list[Phase] = [
     Phase.PR,
 ]
 
+# Position of each phase in PHASE_ORDER (O(1) lookup instead of list.index)
+PHASE_INDEX: dict[Phase, int] = {phase: i for i, phase in enumerate(PHASE_ORDER)}
+
+# Phase groups used by the is_* predicates and by callers that already hold
+# a WorkflowState (avoids several predicate calls on the same state)
+RUNNING_PHASES: frozenset[Phase] = frozenset({
+    Phase.SPECIFICATION,
+    Phase.IMPLEMENTATION,
+    Phase.QA,
+    Phase.PR,
+})
+
+AWAITING_VALIDATION_PHASES: frozenset[Phase] = frozenset({
+    Phase.AWAITING_SPEC_VALIDATION,
+    Phase.AWAITING_QA_VALIDATION,
+})
+
+FINISHED_PHASES: frozenset[Phase] = frozenset({
+    Phase.COMPLETED,
+    Phase.FAILED,
+    Phase.REJECTED,
+})
+
+# Phases entered with Status.PENDING by transition(); every other phase runs
+PENDING_STATUS_PHASES: frozenset[Phase] = FINISHED_PHASES | AWAITING_VALIDATION_PHASES
+
 
 # Valid transitions between phases
 # Note: IDLE can transition to all active phases to support
@@ -204,6 +236,12 @@ class StateManager:
         self._state: Optional[WorkflowState] = None
         self._lock = threading.Lock()
 
+        # Task-level saves deferred by batch(): nesting depth, count of
+        # deferred saves and monotonic time of the oldest one
+        self._batch_depth = 0
+        self._deferred_saves = 0
+        self._deferred_since = 0.0
+
     @property
     def state(self) -> WorkflowState:
         """Retourne l'état actuel, le charge si nécessaire.
@@ -259,6 +297,50 @@ class StateManager:
                 temp_file.unlink(missing_ok=True)
             raise
 
+        # The whole state was written, deferred changes included
+        self._deferred_saves = 0
+
+    def _save_or_defer_unlocked(self) -> None:
+        """Save state, or defer the write while a batch() is open.
+
+        Caller must hold self._lock. Deferred changes stay in memory and are
+        written by the next non-deferred save, when the batch ends, or when a
+        deferred save finds STATE_BATCH_MAX_WRITES saves pending or the oldest
+        one at least STATE_BATCH_MAX_DELAY_SECONDS old (there is no timer).
+        """
+        if not self._batch_depth:
+            self._save_unlocked()
+            return
+
+        if not self._deferred_saves:
+            self._deferred_since = monotonic()
+        self._deferred_saves += 1
+        if (
+            self._deferred_saves >= STATE_BATCH_MAX_WRITES
+            or monotonic() - self._deferred_since >= STATE_BATCH_MAX_DELAY_SECONDS
+        ):
+            self._save_unlocked()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce task counter writes for the duration of the block.
+
+        update_tasks() updates the in-memory state immediately but writes
+        state.json at most every few calls; any other state change, task
+        checkpoints included, still writes immediately (and carries the
+        deferred changes with it). Pending changes are written when the block exits.
+        Batches can be nested.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._deferred_saves:
+                    self._save_unlocked()
+
     def save(self) -> None:
         """Sauvegarde l'état dans le fichier avec garantie d'atomicité.
 
@@ -291,10 +373,9 @@ class StateManager:
                 return False
 
             self._state.phase = new_phase
-            self._state.status = Status.RUNNING if new_phase not in (
-                Phase.COMPLETED, Phase.FAILED, Phase.REJECTED,
-                Phase.AWAITING_SPEC_VALIDATION, Phase.AWAITING_QA_VALIDATION
-            ) else Status.PENDING
+            self._state.status = (
+                Status.PENDING if new_phase in PENDING_STATUS_PHASES else Status.RUNNING
+            )
 
             if new_phase == Phase.SPECIFICATION:
                 self._state.started_at = datetime.now().isoformat()
@@ -347,7 +428,7 @@ class StateManager:
                 self._state = self.load()
             self._state.tasks_completed = completed
             self._state.tasks_total = total
-            self._save_unlocked()
+            self._save_or_defer_unlocked()
 
     def mark_phase_completed(self, phase: Phase) -> None:
         """Marque une phase comme complétée pour permettre la reprise.
@@ -437,24 +518,12 @@ class StateManager:
 
     def is_running(self) -> bool:
         """Vérifie si le workflow est en cours."""
-        return self.state.phase in (
-            Phase.SPECIFICATION,
-            Phase.IMPLEMENTATION,
-            Phase.QA,
-            Phase.PR,
-        )
+        return self.state.phase in RUNNING_PHASES
 
     def is_awaiting_validation(self) -> bool:
         """Vérifie si le workflow attend une validation."""
-        return self.state.phase in (
-            Phase.AWAITING_SPEC_VALIDATION,
-            Phase.AWAITING_QA_VALIDATION,
-        )
+        return self.state.phase in AWAITING_VALIDATION_PHASES
 
     def is_finished(self) -> bool:
         """Vérifie si le workflow est terminé."""
-        return self.state.phase in (
-            Phase.COMPLETED,
-            Phase.FAILED,
-            Phase.REJECTED,
-        )
+        return self.state.phase in FINISHED_PHASES
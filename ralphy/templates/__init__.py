@@ -1,5 +1,7 @@
 """Template generation for Ralphy PRD, agents, and config files."""
 
+from functools import cache
+
 from ralphy.constants import (
     CB_INACTIVITY_TIMEOUT_SECONDS,
     CB_MAX_ATTEMPTS,
@@ -40,18 +42,21 @@ Implement the feature as described above.
 """
 
 
-# List of agent files to copy
-AGENT_FILES = [
+# Agent files to copy (static table, fixed at import time)
+AGENT_FILES: tuple[str, ...] = (
     "spec-agent.md",
     "dev-agent.md",
     "qa-agent.md",
     "pr-agent.md",
-]
+)
 
 
+@cache
 def generate_config_template() -> str:
     """Generate config.yaml template with default values and documentation.
 
+    The template only depends on module constants, so it is built once.
+
     Returns:
         A YAML string with all config sections, default values, and comments.
     """
@@ -74,10 +74,12 @@ class HumanValidator:
         files = ["SPEC.md", f"TASKS.md ({tasks_count} tasks)"]
 
         # Read specification summary
-        spec_path = feature_dir / "SPEC.md"
         summary = None
-        if spec_path.exists():
-            content = spec_path.read_text(encoding="utf-8")
+        try:
+            content = (feature_dir / "SPEC.md").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+        else:
             # Extract first significant lines
             lines = content.split("\n")[:SPEC_PREVIEW_LINES]
             summary = "\n".join(lines)
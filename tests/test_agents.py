@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from ralphy.agents import tasks
 from ralphy.agents.base import AgentResult, BaseAgent
 from ralphy.agents.dev import DevAgent
 from ralphy.agents.spec import SpecAgent
@@ -54,6 +55,13 @@ class TestBaseAgent:
         content = agent.read_file("MISSING.md")
         assert content is None
 
+    def test_read_feature_file(self, temp_project):
+        """Tests reading present and missing files from the feature directory."""
+        config = ProjectConfig()
+        agent = ConcreteAgent(temp_project, config, feature_dir=temp_project)
+        assert agent.read_feature_file("PRD.md") == "# Test PRD"
+        assert agent.read_feature_file("MISSING.md") is None
+
     def test_agent_stores_model_parameter(self, temp_project):
         """Tests that agent stores the model parameter."""
         config = ProjectConfig()
@@ -153,6 +161,41 @@ class TestDevAgent:
         assert total == 3
         assert completed == 1
 
+    def test_count_task_status_empty_file(self, temp_project):
+        """Test qu'un TASKS.md vide compte (0, 0) (fichier non mappable)."""
+        _, feature_dir = temp_project
+        tasks_path = feature_dir / "TASKS.md"
+        tasks_path.write_text("")
+        assert tasks.count_task_status(tasks_path) == (0, 0)
+
+        tasks_path.write_text("## task 1\n- **STATUS**: Completed\n")
+        assert tasks.count_task_status(tasks_path) == (1, 1)
+
+    def test_count_task_status_reparses_only_on_change(self, temp_project, monkeypatch):
+        """Test que TASKS.md n'est re-parsé que s'il a changé."""
+        project_path, feature_dir = temp_project
+        agent = DevAgent(project_path, ProjectConfig(), feature_dir=feature_dir)
+
+        reads = []
+        original_parse = tasks.parse_task_status
+
+        def counting_parse(content):
+            reads.append(content)
+            return original_parse(content)
+
+        monkeypatch.setattr(tasks, "parse_task_status", counting_parse)
+        assert agent.count_task_status() == (1, 2)
+        assert agent.count_task_status() == (1, 2)
+        assert len(reads) == 1
+
+        tasks_path = feature_dir / "TASKS.md"
+        tasks_path.write_text(tasks_path.read_text().replace("pending", "completed"))
+        assert agent.count_task_status() == (2, 2)
+        assert len(reads) == 2
+
+        tasks_path.unlink()
+        assert agent.count_task_status() == (0, 0)
+
     def test_get_in_progress_task(self, temp_project):
         """Test de la détection d'une tâche in_progress."""
         project_path, feature_dir = temp_project
@@ -4,11 +4,12 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import click
 import pytest
 import yaml
 from click.testing import CliRunner
 
-from ralphy.cli import description_to_feature_name, generate_quick_prd, main
+from ralphy.cli import LazyGroup, description_to_feature_name, generate_quick_prd, main
 from ralphy.config import load_config
 from ralphy.state import Phase, StateManager
 
@@ -40,6 +41,35 @@ def project_without_prd(tmp_path):
     return tmp_path
 
 
+class TestLazyGroup:
+    """Tests for lazy subcommand loading."""
+
+    def test_commands_resolve_to_their_module(self):
+        """Each registered command loads and carries the expected name."""
+        ctx = click.Context(main)
+        for name in main.list_commands(ctx):
+            assert main.get_command(ctx, name).name == name
+
+    def test_static_help_matches_command_docstring(self):
+        """The static short help stays in sync with each command's docstring."""
+        ctx = click.Context(main)
+        for name, (_, short_help) in LazyGroup.COMMANDS.items():
+            assert main.get_command(ctx, name).get_short_help_str() == short_help
+
+    def test_unknown_command(self, runner):
+        """An unknown command is reported by Click."""
+        result = runner.invoke(main, ["unknown"])
+        assert result.exit_code != 0
+        assert "No such command" in result.output
+
+    def test_help_lists_commands(self, runner):
+        """Top-level help lists all commands."""
+        result = runner.invoke(main, ["--help"])
+        assert result.exit_code == 0
+        for name in LazyGroup.COMMANDS:
+            assert name in result.output
+
+
 class TestStatusCommand:
     """Tests for the status command."""
 
@@ -94,6 +124,32 @@ class TestStatusCommand:
         assert FEATURE_NAME in result.output
         assert "other-feature" in result.output
 
+    def test_status_plain_output_when_piped(self, runner, project_with_prd, monkeypatch):
+        """Test that non-terminal output is plain key=value lines."""
+        monkeypatch.chdir(project_with_prd)
+        state_manager = StateManager(project_with_prd, FEATURE_NAME)
+        state_manager.state.phase = Phase.IMPLEMENTATION
+        state_manager.state.tasks_completed = 3
+        state_manager.state.tasks_total = 10
+        state_manager.save()
+
+        result = runner.invoke(main, ["status", FEATURE_NAME])
+        assert result.exit_code == 0
+        assert "phase=implementation" in result.output.splitlines()
+        assert "tasks=3/10" in result.output.splitlines()
+
+    def test_status_table_on_terminal(self, runner, project_with_prd, monkeypatch):
+        """Test that a terminal gets the Rich table."""
+        from rich.console import Console
+
+        monkeypatch.chdir(project_with_prd)
+        console = Console(force_terminal=True, width=100)
+        with patch("ralphy._cli_status.get_console", return_value=console):
+            result = runner.invoke(main, ["status", FEATURE_NAME])
+        assert result.exit_code == 0
+        assert "Statut Ralphy" in result.output
+        assert "phase=" not in result.output
+
 
 class TestResetCommand:
     """Tests for the reset command."""
@@ -151,7 +207,7 @@ class TestAbortCommand:
         state_manager.save()
 
         # Mock the abort function to avoid actual process killing
-        with patch("ralphy.cli.abort_running_claude", return_value=False):
+        with patch("ralphy._cli_abort.abort_running_claude", return_value=False):
             result = runner.invoke(main, ["abort", FEATURE_NAME])
             assert result.exit_code == 0
 
@@ -181,9 +237,9 @@ class TestStartCommand:
     def test_start_missing_prd(self, runner, project_without_prd, monkeypatch):
         """Test start command when PRD.md is missing."""
         monkeypatch.chdir(project_without_prd)
-        with patch("ralphy.cli.check_claude_installed", return_value=True), \
-             patch("ralphy.cli.check_git_installed", return_value=True), \
-             patch("ralphy.cli.check_gh_installed", return_value=True):
+        with patch("ralphy._cli_start.check_claude_installed", return_value=True), \
+             patch("ralphy._cli_start.check_git_installed", return_value=True), \
+             patch("ralphy._cli_start.check_gh_installed", return_value=True):
             result = runner.invoke(main, ["start", FEATURE_NAME])
             assert result.exit_code != 0
             assert "prd" in result.output.lower()
@@ -191,7 +247,7 @@ class TestStartCommand:
     def test_start_missing_claude(self, runner, project_with_prd, monkeypatch):
         """Test start command when Claude CLI is not installed."""
         monkeypatch.chdir(project_with_prd)
-        with patch("ralphy.cli.check_claude_installed", return_value=False):
+        with patch("ralphy._cli_start.check_claude_installed", return_value=False):
             result = runner.invoke(main, ["start", FEATURE_NAME])
             assert result.exit_code != 0
             assert "claude" in result.output.lower()
@@ -199,8 +255,8 @@ class TestStartCommand:
     def test_start_missing_git(self, runner, project_with_prd, monkeypatch):
         """Test start command when git is not installed."""
         monkeypatch.chdir(project_with_prd)
-        with patch("ralphy.cli.check_claude_installed", return_value=True), \
-             patch("ralphy.cli.check_git_installed", return_value=False):
+        with patch("ralphy._cli_start.check_claude_installed", return_value=True), \
+             patch("ralphy._cli_start.check_git_installed", return_value=False):
             result = runner.invoke(main, ["start", FEATURE_NAME])
             assert result.exit_code != 0
             assert "git" in result.output.lower()
@@ -208,9 +264,9 @@ class TestStartCommand:
     def test_start_missing_gh(self, runner, project_with_prd, monkeypatch):
         """Test start command when gh CLI is not installed."""
         monkeypatch.chdir(project_with_prd)
-        with patch("ralphy.cli.check_claude_installed", return_value=True), \
-             patch("ralphy.cli.check_git_installed", return_value=True), \
-             patch("ralphy.cli.check_gh_installed", return_value=False):
+        with patch("ralphy._cli_start.check_claude_installed", return_value=True), \
+             patch("ralphy._cli_start.check_git_installed", return_value=True), \
+             patch("ralphy._cli_start.check_gh_installed", return_value=False):
             result = runner.invoke(main, ["start", FEATURE_NAME])
             assert result.exit_code != 0
             assert "gh" in result.output.lower()
@@ -223,9 +279,9 @@ class TestStartCommand:
         state_manager.state.phase = Phase.IMPLEMENTATION
         state_manager.save()
 
-        with patch("ralphy.cli.check_claude_installed", return_value=True), \
-             patch("ralphy.cli.check_git_installed", return_value=True), \
-             patch("ralphy.cli.check_gh_installed", return_value=True):
+        with patch("ralphy._cli_start.check_claude_installed", return_value=True), \
+             patch("ralphy._cli_start.check_git_installed", return_value=True), \
+             patch("ralphy._cli_start.check_gh_installed", return_value=True):
             # User says no to reset
             result = runner.invoke(main, ["start", FEATURE_NAME], input="n\n")
             assert result.exit_code == 0
@@ -237,9 +293,9 @@ class TestStartCommand:
     def test_start_invalid_feature_name(self, runner, project_with_prd, monkeypatch):
         """Test start command with invalid feature name."""
         monkeypatch.chdir(project_with_prd)
-        with patch("ralphy.cli.check_claude_installed", return_value=True), \
-             patch("ralphy.cli.check_git_installed", return_value=True), \
-             patch("ralphy.cli.check_gh_installed", return_value=True):
+        with patch("ralphy._cli_start.check_claude_installed", return_value=True), \
+             patch("ralphy._cli_start.check_git_installed", return_value=True), \
+             patch("ralphy._cli_start.check_gh_installed", return_value=True):
             # Use underscore prefix which violates the regex pattern
             # (must start with alphanumeric, not underscore)
             result = runner.invoke(main, ["start", "_invalid-name"])
@@ -581,10 +637,10 @@ class TestQuickStartCommand:
         """Test that quick start mode creates PRD.md from description."""
         monkeypatch.chdir(tmp_path)
 
-        with patch("ralphy.cli.check_claude_installed", return_value=True), \
-             patch("ralphy.cli.check_git_installed", return_value=True), \
-             patch("ralphy.cli.check_gh_installed", return_value=True), \
-             patch("ralphy.cli.Orchestrator") as mock_orch:
+        with patch("ralphy._cli_start.check_claude_installed", return_value=True), \
+             patch("ralphy._cli_start.check_git_installed", return_value=True), \
+             patch("ralphy._cli_start.check_gh_installed", return_value=True), \
+             patch("ralphy._cli_start.Orchestrator") as mock_orch:
             # Make orchestrator.run() return True
             mock_instance = mock_orch.return_value
             mock_instance.run.return_value = True
@@ -610,10 +666,10 @@ class TestQuickStartCommand:
         original_content = "# My Custom PRD\n\nCustom content"
         prd_path.write_text(original_content)
 
-        with patch("ralphy.cli.check_claude_installed", return_value=True), \
-             patch("ralphy.cli.check_git_installed", return_value=True), \
-             patch("ralphy.cli.check_gh_installed", return_value=True), \
-             patch("ralphy.cli.Orchestrator") as mock_orch:
+        with patch("ralphy._cli_start.check_claude_installed", return_value=True), \
+             patch("ralphy._cli_start.check_git_installed", return_value=True), \
+             patch("ralphy._cli_start.check_gh_installed", return_value=True), \
+             patch("ralphy._cli_start.Orchestrator") as mock_orch:
             mock_instance = mock_orch.return_value
             mock_instance.run.return_value = True
 
@@ -636,10 +692,10 @@ class TestQuickStartCommand:
         original_content = "# Existing Auth PRD"
         prd_path.write_text(original_content)
 
-        with patch("ralphy.cli.check_claude_installed", return_value=True), \
-             patch("ralphy.cli.check_git_installed", return_value=True), \
-             patch("ralphy.cli.check_gh_installed", return_value=True), \
-             patch("ralphy.cli.Orchestrator") as mock_orch:
+        with patch("ralphy._cli_start.check_claude_installed", return_value=True), \
+             patch("ralphy._cli_start.check_git_installed", return_value=True), \
+             patch("ralphy._cli_start.check_gh_installed", return_value=True), \
+             patch("ralphy._cli_start.Orchestrator") as mock_orch:
             mock_instance = mock_orch.return_value
             mock_instance.run.return_value = True
 
@@ -656,9 +712,9 @@ class TestQuickStartCommand:
         """Test that invalid description that can't be converted to slug fails."""
         monkeypatch.chdir(tmp_path)
 
-        with patch("ralphy.cli.check_claude_installed", return_value=True), \
-             patch("ralphy.cli.check_git_installed", return_value=True), \
-             patch("ralphy.cli.check_gh_installed", return_value=True):
+        with patch("ralphy._cli_start.check_claude_installed", return_value=True), \
+             patch("ralphy._cli_start.check_git_installed", return_value=True), \
+             patch("ralphy._cli_start.check_gh_installed", return_value=True):
             result = runner.invoke(main, ["start", "!@#$%"])
             assert result.exit_code != 0
             assert "cannot derive" in result.output.lower()
@@ -667,10 +723,10 @@ class TestQuickStartCommand:
         """Test that valid feature name without PRD triggers quick start."""
         monkeypatch.chdir(tmp_path)
 
-        with patch("ralphy.cli.check_claude_installed", return_value=True), \
-             patch("ralphy.cli.check_git_installed", return_value=True), \
-             patch("ralphy.cli.check_gh_installed", return_value=True), \
-             patch("ralphy.cli.Orchestrator") as mock_orch:
+        with patch("ralphy._cli_start.check_claude_installed", return_value=True), \
+             patch("ralphy._cli_start.check_git_installed", return_value=True), \
+             patch("ralphy._cli_start.check_gh_installed", return_value=True), \
+             patch("ralphy._cli_start.Orchestrator") as mock_orch:
             mock_instance = mock_orch.return_value
             mock_instance.run.return_value = True
 
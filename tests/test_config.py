@@ -1,5 +1,7 @@
 """Tests for the config module."""
 
+import dataclasses
+import os
 import tempfile
 from pathlib import Path
 
@@ -117,6 +119,40 @@ class TestProjectConfig:
         assert config.models.specification == "sonnet"
         assert config.models.qa == "sonnet"
 
+    def test_from_dict_ignores_unknown_keys(self):
+        """Test que les clés inconnues d'une section sont ignorées."""
+        data = {
+            "timeouts": {"qa": 120, "unknown": 42},
+            "retry": {"max_attempts": 5, "jitter": True},
+        }
+        config = ProjectConfig.from_dict(data)
+        assert config.timeouts.qa == 120
+        assert config.retry.max_attempts == 5
+        assert not hasattr(config.timeouts, "unknown")
+
+    def test_config_is_immutable(self):
+        """Test que la config et ses sections sont figées."""
+        config = ProjectConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.name = "other"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.timeouts.qa = 1
+
+    def test_config_dataclasses_use_slots(self):
+        """Test que les dataclasses de config n'ont pas de __dict__ par instance."""
+        config = ProjectConfig()
+        for instance in (config, config.timeouts, config.models, config.stack,
+                         config.retry, config.circuit_breaker):
+            assert not hasattr(instance, "__dict__")
+
+    def test_from_dict_shares_default_sections(self):
+        """Test que les sections non surchargées réutilisent les valeurs par défaut."""
+        first = ProjectConfig.from_dict({"stack": {"language": "python"}})
+        second = ProjectConfig.from_dict({})
+        assert first.timeouts is second.timeouts
+        assert first.stack is not second.stack
+        assert first.timeouts == TimeoutConfig()
+
     def test_to_dict(self):
         """Test de conversion en dictionnaire."""
         config = ProjectConfig(
@@ -158,6 +194,38 @@ class TestConfigIO:
         assert loaded.name == "saved-project"
         assert loaded.stack.language == "rust"
 
+    def test_load_config_is_cached_until_file_changes(self, temp_project):
+        """Test que la config parsée est réutilisée tant que le fichier ne change pas."""
+        config_path = temp_project / ".ralphy" / "config.yaml"
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_text("stack:\n  language: python\n")
+
+        first = load_config(temp_project)
+        assert load_config(temp_project) is first
+
+        # A different size invalidates the cache even within the mtime granularity
+        config_path.write_text("stack:\n  language: rust\n")
+        reloaded = load_config(temp_project)
+        assert reloaded is not first
+        assert reloaded.stack.language == "rust"
+
+    def test_load_config_reloads_replaced_file(self, temp_project):
+        """Test qu'un fichier remplacé (nouvel inode) est relu, même à taille et mtime égales."""
+        config_path = temp_project / ".ralphy" / "config.yaml"
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_text("stack:\n  language: python\n")
+        first = load_config(temp_project)
+        st = config_path.stat()
+
+        replacement = config_path.with_suffix(".tmp")
+        replacement.write_text("stack:\n  language: golang\n")
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        keep_inode = config_path.with_suffix(".old")
+        config_path.rename(keep_inode)  # keep the old inode alive so it is not reused
+        replacement.rename(config_path)
+
+        assert load_config(temp_project).stack.language == "golang"
+
     def test_ensure_ralph_dir(self, temp_project):
         """Test de création du dossier .ralphy."""
         ralph_dir = ensure_ralph_dir(temp_project)
@@ -1,6 +1,8 @@
 """Tests for the journal module."""
 
+import importlib.util
 import json
+import sys
 import threading
 import time
 from datetime import datetime, timezone
@@ -16,6 +18,8 @@ from ralphy.journal import (
     PhaseSummary,
     WorkflowJournal,
     WorkflowSummary,
+    _dumps_event,
+    _dumps_line,
     _now_iso,
 )
 from ralphy.progress import Activity, ActivityType
@@ -69,6 +73,47 @@ class TestJournalEvent:
         assert d["phase"] == "SPECIFICATION"
         assert d["data"] == {"model": "sonnet", "timeout": 1800}
 
+    def test_event_serialization_matches_to_dict(self):
+        """Test that the JSONL encoder writes the same fields as to_dict()."""
+        event = JournalEvent(
+            timestamp="2026-01-22T10:00:00+00:00",
+            event_type=EventType.TOKEN_UPDATE,
+            phase="IMPLEMENTATION",
+            data={"input_tokens": 10, "cost_usd": 0.5},
+        )
+        assert json.loads(_dumps_event(event)) == event.to_dict()
+
+        line = _dumps_line(event)
+        assert line.endswith(b"\n") and line.count(b"\n") == 1
+        assert json.loads(line) == event.to_dict()
+
+    def test_event_serialization_without_orjson(self, monkeypatch):
+        """Test que l'encodeur json de secours produit les mêmes lignes sans orjson."""
+        import ralphy.journal
+
+        # Load a separate copy of the module with orjson blocked, leaving
+        # ralphy.journal (and its classes) untouched for the other tests
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        spec = importlib.util.spec_from_file_location(
+            "ralphy._journal_without_orjson", ralphy.journal.__file__
+        )
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, spec.name, module)
+        spec.loader.exec_module(module)
+        assert module.orjson is None
+
+        event = module.JournalEvent(
+            timestamp="2026-01-22T10:00:00+00:00",
+            event_type=module.EventType.TOKEN_UPDATE,
+            phase="IMPLEMENTATION",
+            data={"input_tokens": 10, "cost_usd": 0.5},
+        )
+        assert json.loads(module._dumps_event(event)) == event.to_dict()
+        line = module._dumps_line(event)
+        assert line.endswith(b"\n") and line.count(b"\n") == 1
+        assert json.loads(line) == event.to_dict()
+        assert json.loads(module._dumps_indented({"a": [1, 2]})) == {"a": [1, 2]}
+
     def test_event_from_dict(self):
         """Test création depuis un dictionnaire."""
         d = {
@@ -334,12 +379,31 @@ class TestWorkflowJournal:
             assert end_event["data"]["outcome"] == "success"
             assert end_event["data"]["cost_usd"] == 0.50
 
+    def test_durations_use_monotonic_clock(self, journal, temp_feature_dir, monkeypatch):
+        """Test que les durées sont mesurées avec l'horloge monotone."""
+        clock = {"now": 100.0}
+        monkeypatch.setattr("ralphy.journal.monotonic", lambda: clock["now"])
+
+        journal.start_workflow()
+        clock["now"] = 110.0
+        journal.start_phase("SPECIFICATION")
+        clock["now"] = 122.5
+        journal.end_phase("success")
+        clock["now"] = 130.0
+        journal.end_workflow("completed")
+
+        summary_path = temp_feature_dir / ".ralphy" / "progress_summary.json"
+        summary = json.loads(summary_path.read_text())
+        assert summary["phases"][0]["duration_seconds"] == 12.5
+        assert summary["total_duration_seconds"] == 30.0
+
     def test_record_task_event_start(self, journal, temp_feature_dir):
         """Test enregistrement d'un événement task start."""
         journal.start_workflow()
         journal.start_phase("IMPLEMENTATION")
         journal.record_task_event("start", "1.2", "Create user model")
 
+        journal.flush()
         jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
         with open(jsonl_path) as f:
             lines = f.readlines()
@@ -354,6 +418,7 @@ class TestWorkflowJournal:
         journal.start_phase("IMPLEMENTATION")
         journal.record_task_event("complete", "1.2", "Create user model")
 
+        journal.flush()
         jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
         with open(jsonl_path) as f:
             lines = f.readlines()
@@ -372,6 +437,7 @@ class TestWorkflowJournal:
         )
         journal.record_activity(activity)
 
+        journal.flush()
         jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
         with open(jsonl_path) as f:
             lines = f.readlines()
@@ -396,6 +462,7 @@ class TestWorkflowJournal:
 
         journal.record_token_update(usage, 0.05)
 
+        journal.flush()
         jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
         with open(jsonl_path) as f:
             lines = f.readlines()
@@ -405,6 +472,111 @@ class TestWorkflowJournal:
             assert token_event["data"]["output_tokens"] == 500
             assert token_event["data"]["cost_usd"] == 0.05
 
+    def test_last_token_snapshot_tracks_current_phase(self, journal):
+        """Test que le journal expose les derniers tokens et coût de la phase."""
+        journal.start_workflow()
+        journal.start_phase("IMPLEMENTATION")
+        assert journal.snapshot_last_token_dict() is None
+        assert journal.last_cost() == 0.0
+
+        usage = MagicMock()
+        usage.input_tokens = 1500
+        usage.output_tokens = 500
+        usage.cache_read_tokens = 100
+        usage.cache_creation_tokens = 50
+        usage.total_tokens = 2150
+        usage.context_utilization = 1.075
+        journal.record_token_update(usage, 0.05)
+
+        assert journal.snapshot_last_token_dict() == {
+            "input_tokens": 1500,
+            "output_tokens": 500,
+            "cache_read_tokens": 100,
+            "cache_creation_tokens": 50,
+        }
+        assert journal.last_cost() == 0.05
+
+        journal.end_phase("success")
+        assert journal.snapshot_last_token_dict() is None
+        assert journal.last_cost() == 0.0
+
+    def test_token_updates_are_rate_limited(self, journal, temp_feature_dir):
+        """Test qu'une rafale de mises à jour ne persiste que la première et la dernière."""
+        journal.start_workflow()
+        journal.start_phase("IMPLEMENTATION")
+
+        usage = MagicMock()
+        usage.cache_read_tokens = 0
+        usage.cache_creation_tokens = 0
+        usage.context_utilization = 0.0
+        for i in range(1, 51):
+            usage.input_tokens = i * 100
+            usage.output_tokens = i * 10
+            usage.total_tokens = i * 110
+            journal.record_token_update(usage, i * 0.01)
+
+        journal.flush()
+        jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
+        events = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+        token_events = [e for e in events if e["event_type"] == "token_update"]
+        assert len(token_events) == 1
+        assert token_events[0]["data"]["input_tokens"] == 100
+
+        # The latest counts are written before PHASE_END
+        journal.end_phase("success")
+        events = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+        assert events[-2]["event_type"] == "token_update"
+        assert events[-2]["data"]["input_tokens"] == 5000
+        assert events[-1]["event_type"] == "phase_end"
+
+    def test_queued_token_updates_are_coalesced(self, journal, temp_feature_dir, monkeypatch):
+        """Test que des mises à jour de tokens consécutives en file n'écrivent que la dernière."""
+        monkeypatch.setattr("ralphy.journal.JOURNAL_TOKEN_UPDATE_INTERVAL_SECONDS", 0.0)
+        journal.start_workflow()
+
+        entered = threading.Event()
+        release = threading.Event()
+        original_append_batch = JournalWriter.append_batch
+
+        def gated_append_batch(self, events, flush=False):
+            entered.set()
+            release.wait(timeout=5)
+            original_append_batch(self, events, flush=flush)
+
+        monkeypatch.setattr(JournalWriter, "append_batch", gated_append_batch)
+        journal.record_task_event("start", "1.1")
+        assert entered.wait(timeout=5)
+
+        # The writer thread is busy: these snapshots pile up in the queue
+        usage = MagicMock(cache_read_tokens=0, cache_creation_tokens=0, context_utilization=0.0)
+        for i in range(1, 6):
+            usage.input_tokens = usage.output_tokens = usage.total_tokens = i
+            journal.record_token_update(usage, 0.0)
+        release.set()
+        journal.flush()
+
+        jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
+        events = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+        token_events = [e for e in events if e["event_type"] == "token_update"]
+        assert [e["data"]["input_tokens"] for e in token_events] == [5]
+
+    def test_fsync_only_at_phase_and_workflow_end(self, journal, monkeypatch):
+        """Test que fsync n'est appelé qu'à la fin d'une phase et du workflow."""
+        fsync_calls = []
+        monkeypatch.setattr("ralphy.journal.os.fsync", fsync_calls.append)
+
+        journal.start_workflow()
+        journal.start_phase("IMPLEMENTATION")
+        journal.record_task_event("start", "1.1")
+        journal.record_task_event("complete", "1.1")
+        journal.flush()
+        assert fsync_calls == []
+
+        journal.end_phase("success")
+        assert len(fsync_calls) == 1
+        journal.end_workflow("completed")
+        assert len(fsync_calls) == 2
+
     def test_record_circuit_breaker(self, journal, temp_feature_dir):
         """Test enregistrement d'un événement circuit breaker."""
         journal.start_workflow()
@@ -448,6 +620,20 @@ class TestWorkflowJournal:
             assert error_event["data"]["error_type"] == "timeout"
             assert error_event["data"]["message"] == "Connection timeout"
 
+    def test_event_timestamps_are_exact_and_ordered(self, journal, temp_feature_dir):
+        """Test que tous les événements ont un timestamp exact, dans l'ordre d'écriture."""
+        journal.start_workflow()
+        journal.start_phase("IMPLEMENTATION")
+        journal.record_task_event("start", "1.2")
+        journal.record_activity(Activity(ActivityType.THINKING, "Analyzing..."))
+        journal.record_error("Connection timeout", "timeout")
+
+        journal.flush()
+        jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
+        events = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+        timestamps = [datetime.fromisoformat(e["timestamp"]) for e in events]
+        assert timestamps == sorted(timestamps)
+
     def test_full_workflow_lifecycle(self, journal, temp_feature_dir):
         """Test cycle de vie complet d'un workflow."""
         # Start workflow
@@ -529,6 +715,7 @@ class TestWorkflowJournalThreadSafety:
         assert len(errors) == 0, f"Errors during concurrent writes: {errors}"
 
         # Vérifier que tous les événements ont été écrits
+        journal.flush()
         jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
         with open(jsonl_path) as f:
             lines = f.readlines()
@@ -536,6 +723,90 @@ class TestWorkflowJournalThreadSafety:
             # (10 threads × 10 iterations × 2 events each = 200)
             assert len(lines) == 202
 
+    def test_events_written_by_background_thread(self, temp_feature_dir, monkeypatch):
+        """Test que les écritures se font hors du thread appelant."""
+        journal = WorkflowJournal(temp_feature_dir, "test-feature")
+        journal.start_workflow()
+
+        writer_threads = set()
+        original_append_batch = JournalWriter.append_batch
+
+        def tracking_append_batch(self, events, flush=False):
+            writer_threads.add(threading.current_thread())
+            original_append_batch(self, events, flush=flush)
+
+        monkeypatch.setattr(JournalWriter, "append_batch", tracking_append_batch)
+        journal.record_task_event("start", "1.1")
+        journal.flush()
+
+        assert writer_threads
+        assert threading.current_thread() not in writer_threads
+
+    def test_slow_write_does_not_block_other_producers(self, temp_feature_dir, monkeypatch):
+        """Test qu'un événement en attente d'écriture ne bloque pas les autres producteurs."""
+        journal = WorkflowJournal(temp_feature_dir, "test-feature")
+        journal.start_workflow()
+
+        release = threading.Event()
+        original_append_batch = JournalWriter.append_batch
+
+        def slow_append_batch(self, events, flush=False):
+            release.wait(timeout=5)
+            original_append_batch(self, events, flush=flush)
+
+        monkeypatch.setattr(JournalWriter, "append_batch", slow_append_batch)
+        error_thread = threading.Thread(target=journal.record_error, args=("boom",))
+        error_thread.start()
+
+        recorded = threading.Event()
+
+        def record_task():
+            journal.record_task_event("start", "1.1")
+            recorded.set()
+
+        threading.Thread(target=record_task).start()
+        try:
+            assert recorded.wait(timeout=2)
+        finally:
+            release.set()
+            error_thread.join(timeout=5)
+
+    def test_write_error_is_raised_by_flush(self, temp_feature_dir, monkeypatch):
+        """Test qu'une erreur d'écriture du thread est remontée par flush()."""
+        journal = WorkflowJournal(temp_feature_dir, "test-feature")
+        journal.start_workflow()
+
+        def failing_append_batch(self, events, flush=False):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(JournalWriter, "append_batch", failing_append_batch)
+        journal.record_task_event("start", "1.1")
+        with pytest.raises(OSError, match="disk full"):
+            journal.flush()
+
+        # The writer thread survives and the error is reported only once
+        monkeypatch.undo()
+        journal.record_task_event("start", "1.2")
+        journal.flush()
+        assert journal._writer_thread.is_alive()
+        journal.end_workflow("completed")
+
+    def test_end_workflow_stops_writer_thread(self, temp_feature_dir):
+        """Test que end_workflow écrit tout puis arrête le thread d'écriture."""
+        journal = WorkflowJournal(temp_feature_dir, "test-feature")
+        journal.start_workflow()
+        writer_thread = journal._writer_thread
+        assert writer_thread.is_alive()
+
+        for i in range(10):
+            journal.record_task_event("start", f"1.{i}")
+        journal.end_workflow("completed")
+
+        assert not writer_thread.is_alive()
+        jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
+        event_types = [json.loads(line)["event_type"] for line in jsonl_path.read_text().splitlines()]
+        assert event_types == ["workflow_start"] + ["task_start"] * 10 + ["workflow_end"]
+
     def test_concurrent_read_write(self, temp_feature_dir):
         """Test lecture/écriture concurrentes."""
         journal = WorkflowJournal(temp_feature_dir, "test-feature")
@@ -708,12 +979,106 @@ class TestJournalWriter:
         writer.append_event(event1)
         writer.append_event(event2)
 
+        writer.flush()
         with open(journal_path) as f:
             lines = f.readlines()
             assert len(lines) == 2
             assert json.loads(lines[0])["event_type"] == "workflow_start"
             assert json.loads(lines[1])["event_type"] == "phase_start"
 
+    def test_events_are_batched_until_flush(self, temp_paths, monkeypatch):
+        """Test that events within the batch window are written on flush."""
+        monkeypatch.setattr("ralphy.journal.JOURNAL_BATCH_MAX_DELAY_SECONDS", 60)
+        journal_path, summary_path = temp_paths
+        writer = JournalWriter(journal_path, summary_path)
+
+        for i in range(3):
+            writer.append_event(JournalEvent(
+                timestamp="2026-01-22T10:00:00+00:00",
+                event_type=EventType.ACTIVITY,
+                phase="IMPLEMENTATION",
+                data={"i": i},
+            ))
+
+        # First event is written right away, the next ones are buffered
+        assert len(journal_path.read_text().splitlines()) == 1
+
+        writer.flush()
+        lines = journal_path.read_text().splitlines()
+        assert [json.loads(line)["data"]["i"] for line in lines] == [0, 1, 2]
+
+    def test_append_event_flush_writes_pending_batch(self, temp_paths, monkeypatch):
+        """Test that a flushing append writes earlier buffered events in order."""
+        monkeypatch.setattr("ralphy.journal.JOURNAL_BATCH_MAX_DELAY_SECONDS", 60)
+        journal_path, summary_path = temp_paths
+        writer = JournalWriter(journal_path, summary_path)
+
+        for event_type in (EventType.WORKFLOW_START, EventType.ACTIVITY):
+            writer.append_event(JournalEvent(
+                timestamp="2026-01-22T10:00:00+00:00",
+                event_type=event_type,
+                phase=None,
+            ))
+        writer.append_event(
+            JournalEvent(
+                timestamp="2026-01-22T10:00:01+00:00",
+                event_type=EventType.WORKFLOW_END,
+                phase=None,
+            ),
+            flush=True,
+        )
+
+        event_types = [json.loads(line)["event_type"] for line in journal_path.read_text().splitlines()]
+        assert event_types == ["workflow_start", "activity", "workflow_end"]
+
+    def test_close_then_append_reopens(self, temp_paths):
+        """Test that the handle is reopened after close()."""
+        journal_path, summary_path = temp_paths
+        writer = JournalWriter(journal_path, summary_path)
+        event = JournalEvent(
+            timestamp="2026-01-22T10:00:00+00:00",
+            event_type=EventType.ERROR,
+            phase=None,
+        )
+
+        writer.append_event(event, flush=True)
+        writer.close()
+        writer.append_event(event, flush=True)
+        writer.close()
+
+        assert len(journal_path.read_text().splitlines()) == 2
+
+    def test_directory_created_once_and_recreated_if_removed(self, temp_paths, monkeypatch):
+        """Test that the directory is created once, then recreated only if removed."""
+        journal_path, summary_path = temp_paths
+        writer = JournalWriter(journal_path, summary_path)
+        event = JournalEvent(
+            timestamp="2026-01-22T10:00:00+00:00",
+            event_type=EventType.ERROR,
+            phase=None,
+        )
+
+        mkdir_calls = []
+        original_ensure_dir = JournalWriter._ensure_dir
+
+        def tracking_ensure_dir(self):
+            mkdir_calls.append(self)
+            original_ensure_dir(self)
+
+        monkeypatch.setattr(JournalWriter, "_ensure_dir", tracking_ensure_dir)
+        writer.append_event(event, flush=True)
+        writer.close()
+        writer.append_event(event, flush=True)
+        writer.close()
+        assert len(mkdir_calls) == 1
+
+        journal_path.unlink()
+        journal_path.parent.rmdir()
+        writer.append_event(event, flush=True)
+        writer.close()
+        assert len(mkdir_calls) == 2
+        assert len(journal_path.read_text().splitlines()) == 1
+
     def test_clear_journal(self, temp_paths):
         """Test that clear_journal removes the file."""
         journal_path, summary_path = temp_paths
@@ -880,6 +1245,7 @@ class TestAgentDelegationJournal:
             task_id="1.5",
         )
 
+        journal.flush()
         jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
         with open(jsonl_path) as f:
             lines = f.readlines()
@@ -898,6 +1264,7 @@ class TestAgentDelegationJournal:
             to_agent="backend-agent",
         )
 
+        journal.flush()
         jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
         with open(jsonl_path) as f:
             lines = f.readlines()
@@ -995,6 +1362,7 @@ class TestAgentDelegationJournal:
         # No start_phase called
         journal.record_agent_delegation("dev-agent", "backend-agent")
 
+        journal.flush()
         jsonl_path = temp_feature_dir / ".ralphy" / "progress.jsonl"
         with open(jsonl_path) as f:
             lines = f.readlines()
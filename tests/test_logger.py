@@ -0,0 +1,97 @@
+"""Tests for the logger module."""
+
+import re
+import time
+from io import StringIO
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+
+import ralphy.logger as logger_module
+from ralphy.logger import Logger, get_logger, set_logger
+
+
+@pytest.fixture(autouse=True)
+def reset_global_logger():
+    """Restores the global logger after each test."""
+    previous = logger_module._logger
+    yield
+    logger_module._logger = previous
+
+
+class TestGetLogger:
+    """Tests for the global logger accessor."""
+
+    def test_returns_same_instance(self):
+        """get_logger() is memoized: repeated calls are a cheap global read."""
+        logger_module._logger = None
+        first = get_logger()
+        assert get_logger() is first
+
+    def test_set_logger_overrides_cached_instance(self):
+        """set_logger() replaces the memoized instance for all callers."""
+        custom = Logger(console=Console(file=StringIO()))
+        set_logger(custom)
+        assert get_logger() is custom
+
+
+class TestLoggerOutput:
+    """Tests for the formatted log lines."""
+
+    @pytest.fixture
+    def output(self):
+        return StringIO()
+
+    @pytest.fixture
+    def logger(self, output):
+        return Logger(console=Console(file=output, width=200))
+
+    def test_log_line_has_timestamp_and_message(self, logger, output):
+        logger.success("Done")
+        assert re.fullmatch(r"\[\d{2}:\d{2}:\d{2}\] Done\n", output.getvalue())
+
+    def test_task_and_validation_markers(self, logger, output):
+        logger.task_start("Build")
+        logger.task_complete("Build")
+        logger.validation("Review")
+        lines = output.getvalue().splitlines()
+        assert lines[0].endswith("] ▶ Build")
+        assert lines[1].endswith("] ✓ Build")
+        assert lines[2].endswith("] === Review ===")
+
+    def test_styles_are_applied_on_terminal(self, output):
+        logger = Logger(console=Console(file=output, force_terminal=True, width=200))
+        logger.error("Boom")
+        assert "\x1b[1;31mBoom" in output.getvalue()
+
+    def test_live_mode_skips_regular_logs(self, logger, output):
+        logger.set_live_mode(True)
+        logger.info("hidden")
+        logger.task_start("shown")
+        assert "hidden" not in output.getvalue()
+        assert "shown" in output.getvalue()
+
+    def test_timestamp_formatted_once_per_second(self, logger, monkeypatch):
+        clock = SimpleNamespace(time=lambda: 1_000_000.4, localtime=time.localtime)
+        calls = []
+
+        def strftime(fmt, t):
+            calls.append(t)
+            return time.strftime(fmt, t)
+
+        clock.strftime = strftime
+        monkeypatch.setattr(logger_module, "time", clock)
+        monkeypatch.setattr(logger_module, "_timestamp_cache", (-1, ""))
+
+        first = logger._timestamp()
+        clock.time = lambda: 1_000_000.9
+        assert logger._timestamp() is first
+        assert len(calls) == 1
+        assert re.fullmatch(r"\[\d{2}:\d{2}:\d{2}\]", first)
+
+    def test_plain_output_skips_rich(self, logger, output, monkeypatch):
+        monkeypatch.setattr(logger.console, "print", lambda *a, **k: pytest.fail("Rich used"))
+        long_message = "x" * 500
+        logger.warn(long_message)
+        assert output.getvalue().endswith(f"] {long_message}\n")
@@ -1,12 +1,19 @@
 """Tests for the orchestrator."""
 
+import json
+import os
+import sys
 import tempfile
+import time
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
+from ralphy import orchestrator as orchestrator_module
+from ralphy.agents.base import AgentResult
 from ralphy.orchestrator import Orchestrator, WorkflowError
-from ralphy.state import Phase, StateManager
+from ralphy.state import PHASE_ORDER, Phase, StateManager
 
 
 FEATURE_NAME = "test-feature"
@@ -66,6 +73,91 @@ class TestOrchestrator:
         with pytest.raises(WorkflowError, match="déjà en cours"):
             orchestrator._validate_prerequisites()
 
+    def test_helpers_are_built_lazily(self, temp_project):
+        """Test que validator, journal et progress display sont créés au premier accès."""
+        orchestrator = Orchestrator(temp_project, feature_name=FEATURE_NAME)
+        for name in ("validator", "_journal", "_progress_display"):
+            assert name not in vars(orchestrator)
+
+        assert orchestrator._journal is orchestrator._journal
+        assert orchestrator._progress_display is not None
+        assert Orchestrator(
+            temp_project, feature_name=FEATURE_NAME, show_progress=False
+        )._progress_display is None
+
+    def test_progress_output_feeds_display_and_user_callback(self, temp_project):
+        """Test que la sortie streamée alimente le display actif puis le callback."""
+        received = []
+        orchestrator = Orchestrator(
+            temp_project, feature_name=FEATURE_NAME, on_output=received.append
+        )
+        orchestrator._progress_display = MagicMock(is_active=True)
+
+        orchestrator.on_output("chunk")
+
+        orchestrator._progress_display.process_output.assert_called_once_with("chunk")
+        assert received == ["chunk"]
+
+    def test_query_dev_agent_cached_per_orchestrator(self, temp_project):
+        """Test que le DevAgent de requête est créé une fois par orchestrator."""
+        first = Orchestrator(temp_project, feature_name=FEATURE_NAME, show_progress=False)
+        second = Orchestrator(temp_project, feature_name=FEATURE_NAME, show_progress=False)
+        agent = first._dev_agent_for_queries
+        assert first._dev_agent_for_queries is agent
+        assert second._dev_agent_for_queries is not agent
+
+    def test_run_agent_phase_merges_agent_and_run_kwargs(self, temp_project):
+        """Test que _run_agent_phase combine kwargs communs, modèle et kwargs spécifiques."""
+        calls = {}
+
+        class FakeAgent:
+            name = "fake-agent"
+
+            def __init__(self, **kwargs):
+                calls["init"] = kwargs
+
+            def run(self, **kwargs):
+                calls["run"] = kwargs
+                return AgentResult(success=True, output="", files_generated=[])
+
+        (temp_project / "docs" / "features" / FEATURE_NAME / ".ralphy").mkdir()
+        orchestrator = Orchestrator(temp_project, feature_name=FEATURE_NAME, show_progress=False)
+        assert orchestrator._run_agent_phase(
+            Phase.PR,
+            "PR",
+            FakeAgent,
+            timeout=60,
+            model="haiku",
+            agent_kwargs={"feature_name": FEATURE_NAME},
+            run_kwargs={"start_from_task": "1.2"},
+        )
+
+        assert calls["init"]["model"] == "haiku"
+        assert calls["init"]["feature_name"] == FEATURE_NAME
+        assert calls["init"]["on_output"] == orchestrator.on_output
+        assert calls["init"]["feature_dir"] == orchestrator.feature_dir
+        assert calls["run"] == {"timeout": 60, "start_from_task": "1.2"}
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="flock is POSIX-only")
+    def test_run_lock_blocks_concurrent_run(self, temp_project):
+        """Test qu'un second run() sur la même feature échoue sans toucher à l'état."""
+        feature_dir = temp_project / "docs" / "features" / FEATURE_NAME
+        (feature_dir / "PRD.md").write_text("# Test PRD")
+
+        holder = Orchestrator(temp_project, feature_name=FEATURE_NAME, show_progress=False)
+        assert holder._acquire_run_lock() is True
+        try:
+            other = Orchestrator(temp_project, feature_name=FEATURE_NAME, show_progress=False)
+            assert other.run() is False
+            assert StateManager(temp_project, FEATURE_NAME).state.phase == Phase.IDLE
+            assert not (feature_dir / ".ralphy" / "progress.jsonl").exists()
+        finally:
+            holder._release_run_lock()
+
+        # Released: the lock can be taken again
+        assert other._acquire_run_lock() is True
+        other._release_run_lock()
+
 
 class TestResumeLogic:
     """Tests pour la logique de reprise du workflow."""
@@ -124,6 +216,13 @@ class TestResumeLogic:
         orchestrator = Orchestrator(temp_project_with_specs, feature_name=FEATURE_NAME)
         assert orchestrator._qa_artifacts_valid() is False
 
+    def test_qa_artifacts_invalid_when_report_is_a_directory(self, temp_project_with_specs):
+        """Test qu'un répertoire nommé QA_REPORT.md n'est pas un artéfact valide."""
+        feature_dir = temp_project_with_specs / "docs" / "features" / FEATURE_NAME
+        (feature_dir / "QA_REPORT.md").mkdir()
+        orchestrator = Orchestrator(temp_project_with_specs, feature_name=FEATURE_NAME)
+        assert orchestrator._qa_artifacts_valid() is False
+
     def test_determine_resume_phase_without_last_completed(self, temp_project_with_specs):
         """Test que _determine_resume_phase retourne None sans last_completed_phase."""
         orchestrator = Orchestrator(temp_project_with_specs, feature_name=FEATURE_NAME)
@@ -169,6 +268,20 @@ class TestResumeLogic:
         resume_phase = orchestrator._determine_resume_phase()
         assert resume_phase == Phase.AWAITING_QA_VALIDATION
 
+    def test_determine_resume_phase_after_qa_validation(self, temp_project_with_qa):
+        """Test de reprise après validation QA: PR, si QA_REPORT.md est présent."""
+        state_manager = StateManager(temp_project_with_qa, FEATURE_NAME)
+        state_manager.mark_phase_completed(Phase.AWAITING_QA_VALIDATION)
+        state_manager.set_failed("Test interruption")
+
+        orchestrator = Orchestrator(temp_project_with_qa, feature_name=FEATURE_NAME)
+        assert orchestrator._determine_resume_phase() == Phase.PR
+
+        feature_dir = temp_project_with_qa / "docs" / "features" / FEATURE_NAME
+        (feature_dir / "QA_REPORT.md").unlink()
+        orchestrator = Orchestrator(temp_project_with_qa, feature_name=FEATURE_NAME)
+        assert orchestrator._determine_resume_phase() is None
+
     def test_determine_resume_phase_with_missing_artifacts(self, temp_project_with_specs):
         """Test que _determine_resume_phase retourne None si artéfacts manquants."""
         state_manager = StateManager(temp_project_with_specs, FEATURE_NAME)
@@ -183,6 +296,88 @@ class TestResumeLogic:
         resume_phase = orchestrator._determine_resume_phase()
         assert resume_phase is None
 
+    def test_phase_steps_follow_phase_order(self, temp_project_with_specs):
+        """Test que la table d'étapes suit PHASE_ORDER (index = position)."""
+        orchestrator = Orchestrator(temp_project_with_specs, feature_name=FEATURE_NAME)
+        assert [step.phase for step in orchestrator._phase_steps()] == PHASE_ORDER
+
+    def test_plan_run_keeps_only_steps_from_resume_point(self, temp_project_with_qa):
+        """Test que _plan_run ne retourne que les étapes à partir de la reprise."""
+        state_manager = StateManager(temp_project_with_qa, FEATURE_NAME)
+        state_manager.mark_phase_completed(Phase.QA)
+        state_manager.set_failed("Test interruption")
+
+        orchestrator = Orchestrator(temp_project_with_qa, feature_name=FEATURE_NAME)
+        plan = orchestrator._plan_run(fresh=False)
+        assert [step.phase for step in plan] == [Phase.AWAITING_QA_VALIDATION, Phase.PR]
+        assert orchestrator.state_manager.state.phase == Phase.IDLE
+
+    def test_plan_run_fresh_keeps_all_steps(self, temp_project_with_qa):
+        """Test que --fresh planifie toutes les étapes malgré une reprise possible."""
+        state_manager = StateManager(temp_project_with_qa, FEATURE_NAME)
+        state_manager.mark_phase_completed(Phase.QA)
+        state_manager.set_failed("Test interruption")
+
+        orchestrator = Orchestrator(temp_project_with_qa, feature_name=FEATURE_NAME)
+        assert len(orchestrator._plan_run(fresh=True)) == 6
+
+    def test_run_resumes_from_phase_table(self, temp_project_with_specs):
+        """Test que run() saute les étapes complétées et s'arrête sur un rejet."""
+        feature_dir = temp_project_with_specs / "docs" / "features" / FEATURE_NAME
+        (feature_dir / "PRD.md").write_text("# Test PRD")
+        state_manager = StateManager(temp_project_with_specs, FEATURE_NAME)
+        state_manager.mark_phase_completed(Phase.AWAITING_SPEC_VALIDATION)
+        state_manager.set_failed("Test interruption")
+
+        orchestrator = Orchestrator(
+            temp_project_with_specs, feature_name=FEATURE_NAME, show_progress=False
+        )
+        calls = []
+        orchestrator._restore_task_count = lambda: calls.append("restore")
+        orchestrator._run_specification_phase = lambda: calls.append("spec")
+        orchestrator._run_implementation_phase = lambda: calls.append("impl") or True
+        orchestrator._run_qa_phase = lambda: calls.append("qa") or True
+        orchestrator._run_qa_validation = lambda: calls.append("qa_validation") or False
+
+        assert orchestrator.run() is False
+        assert calls == ["restore", "impl", "qa", "qa_validation"]
+        state = StateManager(temp_project_with_specs, FEATURE_NAME).state
+        assert state.last_completed_phase == Phase.QA.value
+        summary = json.loads((feature_dir / ".ralphy" / "progress_summary.json").read_text())
+        assert summary["outcome"] == "rejected"
+        assert orchestrator._stat_cache == {}
+
+    def test_artifact_stats_cached_until_cleared(self, temp_project_with_qa):
+        """Test que chaque artéfact n'est stat() qu'une fois jusqu'au prochain reset."""
+        orchestrator = Orchestrator(temp_project_with_qa, feature_name=FEATURE_NAME)
+        assert orchestrator._spec_artifacts_valid() is True
+        assert orchestrator._qa_artifacts_valid() is True
+        assert len(orchestrator._stat_cache) == 3
+
+        # A change on disk is not seen until the cache is cleared
+        feature_dir = temp_project_with_qa / "docs" / "features" / FEATURE_NAME
+        (feature_dir / "QA_REPORT.md").unlink()
+        assert orchestrator._qa_artifacts_valid() is True
+        orchestrator._stat_cache.clear()
+        assert orchestrator._qa_artifacts_valid() is False
+
+    def test_qa_report_summary_reparsed_only_on_change(self, temp_project_with_qa):
+        """Test que le résumé QA est mis en cache tant que QA_REPORT.md ne change pas."""
+        feature_dir = temp_project_with_qa / "docs" / "features" / FEATURE_NAME
+        qa_path = feature_dir / "QA_REPORT.md"
+        qa_path.write_text("# QA\nScore: 7/10\nOne critical issue\n")
+
+        orchestrator = Orchestrator(temp_project_with_qa, feature_name=FEATURE_NAME)
+        first = orchestrator._get_qa_report_summary()
+        assert first == {"score": "7/10", "critical_issues": 1}
+        assert orchestrator._get_qa_report_summary() is first
+
+        qa_path.write_text("# QA\nScore: 9/10\nNo critical issue, one critique\n")
+        assert orchestrator._get_qa_report_summary() == {"score": "9/10", "critical_issues": 2}
+
+        qa_path.unlink()
+        assert orchestrator._get_qa_report_summary()["score"] == "N/A"
+
     def test_should_skip_phase_without_resume(self, temp_project_with_specs):
         """Test que _should_skip_phase retourne False sans phase de reprise."""
         orchestrator = Orchestrator(temp_project_with_specs, feature_name=FEATURE_NAME)
@@ -196,6 +391,12 @@ class TestResumeLogic:
         assert orchestrator._should_skip_phase(Phase.AWAITING_SPEC_VALIDATION, Phase.IMPLEMENTATION) is True
         assert orchestrator._should_skip_phase(Phase.IMPLEMENTATION, Phase.IMPLEMENTATION) is False
 
+    def test_should_skip_phase_outside_phase_order(self, temp_project_with_specs):
+        """Test que les phases hors PHASE_ORDER ne sont jamais sautées."""
+        orchestrator = Orchestrator(temp_project_with_specs, feature_name=FEATURE_NAME)
+        assert orchestrator._should_skip_phase(Phase.IDLE, Phase.QA) is False
+        assert orchestrator._should_skip_phase(Phase.SPECIFICATION, Phase.COMPLETED) is False
+
     def test_should_skip_phase_at_and_after_resume_point(self, temp_project_with_specs):
         """Test que les phases au point de reprise et après ne sont pas sautées."""
         orchestrator = Orchestrator(temp_project_with_specs, feature_name=FEATURE_NAME)
@@ -236,6 +437,62 @@ class TestTaskLevelResume:
 """)
             yield project_path
 
+    def test_restore_task_count_trusts_state_unless_tasks_file_is_newer(
+        self, temp_project_with_tasks
+    ):
+        """Test que la reprise garde les compteurs persistés si TASKS.md n'a pas changé."""
+        state_manager = StateManager(temp_project_with_tasks, FEATURE_NAME)
+        state_manager.update_tasks(1, 4)
+        tasks_path = temp_project_with_tasks / "docs" / "features" / FEATURE_NAME / "TASKS.md"
+        state_mtime = state_manager.state_file.stat().st_mtime_ns
+        os.utime(tasks_path, ns=(state_mtime - 10**9, state_mtime - 10**9))
+
+        orchestrator = Orchestrator(temp_project_with_tasks, feature_name=FEATURE_NAME)
+        orchestrator._restore_task_count()
+        assert orchestrator.state_manager.state.tasks_completed == 1
+
+        # TASKS.md edited after the last state write: recount from the file
+        os.utime(tasks_path, ns=(state_mtime + 10**9, state_mtime + 10**9))
+        orchestrator._restore_task_count()
+        assert orchestrator.state_manager.state.tasks_completed == 2
+        assert orchestrator.state_manager.state.tasks_total == 4
+
+    def test_resume_recounts_tasks_edited_after_failure(self, temp_project_with_tasks):
+        """Test que la reprise via _plan_run recompte un TASKS.md modifié après l'échec."""
+        state_manager = StateManager(temp_project_with_tasks, FEATURE_NAME)
+        state_manager.update_tasks(0, 4)
+        state_manager.mark_phase_completed(Phase.AWAITING_SPEC_VALIDATION)
+        state_manager.set_failed("Test interruption")
+        # Failure 10s ago, TASKS.md edited 5s ago
+        tasks_path = temp_project_with_tasks / "docs" / "features" / FEATURE_NAME / "TASKS.md"
+        now = time.time_ns()
+        os.utime(state_manager.state_file, ns=(now - 10 * 10**9, now - 10 * 10**9))
+        os.utime(tasks_path, ns=(now - 5 * 10**9, now - 5 * 10**9))
+
+        orchestrator = Orchestrator(temp_project_with_tasks, feature_name=FEATURE_NAME)
+        plan = orchestrator._plan_run(fresh=False)
+
+        assert plan[0].phase == Phase.IMPLEMENTATION
+        assert orchestrator.state_manager.state.tasks_completed == 2
+        assert orchestrator.state_manager.state.tasks_total == 4
+
+    def test_resume_keeps_task_count_when_tasks_unchanged(self, temp_project_with_tasks):
+        """Test que la reprise via _plan_run garde les compteurs si TASKS.md est plus ancien."""
+        state_manager = StateManager(temp_project_with_tasks, FEATURE_NAME)
+        state_manager.update_tasks(1, 4)
+        state_manager.mark_phase_completed(Phase.AWAITING_SPEC_VALIDATION)
+        state_manager.set_failed("Test interruption")
+        # TASKS.md edited 10s ago, failure 5s ago
+        tasks_path = temp_project_with_tasks / "docs" / "features" / FEATURE_NAME / "TASKS.md"
+        now = time.time_ns()
+        os.utime(tasks_path, ns=(now - 10 * 10**9, now - 10 * 10**9))
+        os.utime(state_manager.state_file, ns=(now - 5 * 10**9, now - 5 * 10**9))
+
+        orchestrator = Orchestrator(temp_project_with_tasks, feature_name=FEATURE_NAME)
+        orchestrator._plan_run(fresh=False)
+
+        assert orchestrator.state_manager.state.tasks_completed == 1
+
     def test_get_implementation_resume_task_with_completed_checkpoint(
         self, temp_project_with_tasks
     ):
@@ -310,3 +567,50 @@ class TestTaskLevelResume:
 
         # All tasks completed, no resume needed
         assert resume_task is None
+
+    def test_task_polling_wakes_on_completion_and_skips_unchanged_file(
+        self, temp_project_with_tasks, monkeypatch
+    ):
+        """Test que le polling se réveille sur complétion et ne re-parse pas un TASKS.md inchangé."""
+        orchestrator = Orchestrator(
+            temp_project_with_tasks, feature_name=FEATURE_NAME, show_progress=False
+        )
+        counts = []
+        original_count = orchestrator_module.count_task_status
+
+        def counting_count_task_status(tasks_path):
+            result = original_count(tasks_path)
+            counts.append(result)
+            return result
+
+        monkeypatch.setattr(orchestrator_module, "count_task_status", counting_count_task_status)
+
+        def wait_for(predicate, timeout):
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if predicate():
+                    return True
+                time.sleep(0.01)
+            return predicate()
+
+        stop_event = orchestrator._start_task_polling()
+        try:
+            assert wait_for(lambda: len(counts) == 1, timeout=2)
+
+            # Completion detected but TASKS.md unchanged: no re-parse
+            orchestrator._on_task_event("complete", "1.3", None)
+            time.sleep(0.2)
+            assert len(counts) == 1
+
+            # TASKS.md updated: the completion wakes the poller before its 1s period
+            tasks_path = temp_project_with_tasks / "docs" / "features" / FEATURE_NAME / "TASKS.md"
+            tasks_path.write_text(
+                tasks_path.read_text().replace("- **Status**: pending", "- **Status**: completed", 1)
+            )
+            orchestrator._on_task_event("complete", "1.3", None)
+            assert wait_for(lambda: len(counts) == 2, timeout=0.8)
+            assert counts[-1] == (3, 4)
+        finally:
+            orchestrator._stop_task_polling(stop_event)
+
+        assert StateManager(temp_project_with_tasks, FEATURE_NAME).state.tasks_completed == 3
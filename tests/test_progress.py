@@ -1,8 +1,11 @@
 """Tests for the progress module."""
 
+import io
+import time
 from datetime import datetime
 
 import pytest
+from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress
 
@@ -13,6 +16,7 @@ from ralphy.activity import (
     match_agent_name,
     normalize_agent_name,
 )
+from ralphy.constants import PROGRESS_SCAN_WINDOW_CHARS
 from ralphy.progress import (
     ProgressDisplay,
     ProgressRenderer,
@@ -114,6 +118,46 @@ class TestOutputParser:
         assert activity is not None
         assert activity.type == ActivityType.TASK_COMPLETE
 
+    def test_first_listed_pattern_wins_within_a_type(self):
+        """Test que le premier motif listé l'emporte, même s'il matche plus loin."""
+        parser = OutputParser()
+
+        # "### Task ... [..]" matches first in the text, but the in_progress
+        # status pattern is listed first for TASK_START
+        activity = parser.parse("### Task 1.2: [Model - User]\n- **Status**: in_progress")
+        assert activity.type == ActivityType.TASK_START
+        assert activity.detail is None
+
+        activity = parser.parse("### Task 1.2: [Model - User]")
+        assert activity.detail == "1.2:Model - User"
+
+    def test_case_insensitive_match_keeps_original_case(self):
+        """Test que la détection ignore la casse mais garde celle du détail."""
+        parser = OutputParser()
+
+        activity = parser.parse("WRITING src/Models/User.py")
+        assert activity.type == ActivityType.WRITING_FILE
+        assert activity.detail == "src/Models/User.py"
+
+        # "İ" lowercases to two code points: falls back to IGNORECASE matching
+        activity = parser.parse("İ Writing src/Models/User.py")
+        assert activity.type == ActivityType.WRITING_FILE
+        assert activity.detail == "src/Models/User.py"
+
+    def test_status_arrow_patterns_on_long_line(self):
+        """Test les motifs 'pending → in_progress' sur une longue ligne sans match."""
+        parser = OutputParser()
+
+        # Backtracked cubically before (minutes for this line)
+        assert parser.parse("pending → x " * 3000) is None
+
+        activity = parser.parse("x" * 5000 + " pending → x → in_progress")
+        assert activity.type == ActivityType.TASK_START
+        activity = parser.parse("in_progress\n→ completed")
+        assert activity is None
+        activity = parser.parse("in_progress → completed")
+        assert activity.type == ActivityType.TASK_COMPLETE
+
     def test_no_activity_detected(self):
         """Test quand aucune activité n'est détectée."""
         parser = OutputParser()
@@ -124,6 +168,13 @@ class TestOutputParser:
         activity = parser.parse("")
         assert activity is None
 
+    def test_keyword_prefilter_skips_patterns(self, monkeypatch):
+        """Test qu'une sortie sans mot-clé ne passe par aucun motif."""
+        parser = OutputParser()
+        monkeypatch.setattr(parser, "_folded_patterns", None)
+
+        assert parser.parse("Traceback (most recent call last):\n  File 'x.py'") is None
+
 
 class TestProgressState:
     """Tests pour ProgressState."""
@@ -136,7 +187,7 @@ class TestProgressState:
         assert state.tasks_completed == 0
         assert state.tasks_total == 0
         assert state.current_activity is None
-        assert state.last_output_lines == []
+        assert list(state.last_output_lines) == []
 
 
 class TestProgressDisplay:
@@ -204,6 +255,37 @@ class TestProgressDisplay:
 
         display.stop()
 
+    def test_process_output_scans_tail_of_long_output(self):
+        """Test que seule la fin d'une longue sortie est analysée."""
+        display = ProgressDisplay()
+        display.start("IMPLEMENTATION", 10)
+
+        head = "Writing app/models/old.rb\n" + "x" * PROGRESS_SCAN_WINDOW_CHARS
+        display.process_output(head + "\nReading app/models/user.rb")
+        assert display._state.current_activity.type == ActivityType.READING_FILE
+
+        display.process_output(head)
+        assert display._state.current_activity.type == ActivityType.READING_FILE
+
+        display.stop()
+
+    def test_process_output_detects_task_markers_anywhere_in_long_output(self):
+        """Test que les marqueurs de tâche sont détectés au début d'une longue sortie."""
+        events = []
+        display = ProgressDisplay(on_task_event=lambda *event: events.append(event))
+        display.start("IMPLEMENTATION", 10)
+        padding = "\n" + "x" * PROGRESS_SCAN_WINDOW_CHARS + "\nReading app/models/user.rb"
+
+        display.process_output("### Task 1.2: [Model - User]" + padding)
+        assert display._state.current_activity.type == ActivityType.TASK_START
+        assert display._state.current_task_id == "1.2"
+
+        display.process_output("### Task 1.2 - Model\n**Status**: completed" + padding)
+        assert display._state.current_activity.type == ActivityType.TASK_COMPLETE
+        assert events == [("start", "1.2", "Model - User"), ("complete", "1.2", None)]
+
+        display.stop()
+
     def test_process_output_keeps_last_lines(self):
         """Test que les dernières lignes sont gardées."""
         display = ProgressDisplay()
@@ -211,7 +293,11 @@ class TestProgressDisplay:
 
         display.process_output("Line 1\nLine 2\nLine 3\nLine 4\nLine 5")
         # MAX_OUTPUT_LINES = 3
-        assert len(display._state.last_output_lines) <= 3
+        assert list(display._state.last_output_lines) == ["Line 3", "Line 4", "Line 5"]
+
+        # Lines are stripped, short ones skipped, earlier ones kept if needed
+        display.process_output("  Line 6 \r\nok\n\n  \n")
+        assert list(display._state.last_output_lines) == ["Line 4", "Line 5", "Line 6"]
 
         display.stop()
 
@@ -330,6 +416,34 @@ class TestProgressDisplayStart:
 
         display.stop()
 
+    def test_restart_reuses_progress_bars(self):
+        """Test qu'un nouveau start() réutilise les barres, avec les seules nouvelles tâches."""
+        display = ProgressDisplay(console=Console(file=io.StringIO(), width=100))
+        display.start("SPECIFICATION", 5)
+        display.stop()
+        phase_progress = display._phase_progress
+        tasks_progress = display._tasks_progress
+
+        display.start("IMPLEMENTATION", 8)
+        display.stop()
+
+        assert display._phase_progress is phase_progress
+        assert display._tasks_progress is tasks_progress
+        assert [t.description for t in phase_progress.tasks] == ["IMPLEMENTATION"]
+        assert [t.total for t in tasks_progress.tasks] == [8]
+
+    def test_elapsed_uses_monotonic_clock(self):
+        """Test que le temps écoulé vient de l'horloge monotone du start()."""
+        display = ProgressDisplay(console=Console(file=io.StringIO(), width=100))
+        display.start("IMPLEMENTATION", 5)
+        display.stop()
+        # Wall clock start left as is: only the monotonic start is used
+        display._state.phase_started_monotonic = time.monotonic() - 65
+
+        output = io.StringIO()
+        Console(file=output, width=100).print(display.__rich__())
+        assert "Elapsed: 01:05" in output.getvalue()
+
 
 class TestRenderContext:
     """Tests for RenderContext dataclass."""
@@ -340,6 +340,55 @@ class TestTaskCheckpoints:
         manager2 = StateManager(project_path, feature_name)
         assert manager2.state.last_completed_task_id == "2.3"
 
+    def test_batch_defers_task_count_writes(self, temp_project):
+        """Test que batch() regroupe les écritures du compteur de tâches."""
+        project_path, feature_name = temp_project
+        manager = StateManager(project_path, feature_name)
+
+        with manager.batch():
+            manager.update_tasks(4, 10)
+            # In memory immediately, on disk only when the batch ends
+            assert manager.state.tasks_completed == 4
+            assert not manager.state_file.exists()
+        assert StateManager(project_path, feature_name).state.tasks_completed == 4
+
+    def test_batch_flushes_on_write_threshold(self, temp_project, monkeypatch):
+        """Test qu'un batch écrit dès que le seuil de sauvegardes différées est atteint."""
+        monkeypatch.setattr("ralphy.state.STATE_BATCH_MAX_WRITES", 3)
+        project_path, feature_name = temp_project
+        manager = StateManager(project_path, feature_name)
+
+        with manager.batch():
+            manager.update_tasks(1, 10)
+            manager.update_tasks(2, 10)
+            assert not manager.state_file.exists()
+            manager.update_tasks(3, 10)
+            assert StateManager(project_path, feature_name).state.tasks_completed == 3
+
+    def test_batch_writes_checkpoints_immediately(self, temp_project):
+        """Test qu'un checkpoint de tâche est écrit tout de suite, même dans un batch."""
+        project_path, feature_name = temp_project
+        manager = StateManager(project_path, feature_name)
+
+        with manager.batch():
+            manager.update_tasks(4, 10)
+            manager.checkpoint_task("2.3", "in_progress")
+            persisted = StateManager(project_path, feature_name).state
+            assert persisted.last_in_progress_task_id == "2.3"
+            assert persisted.tasks_completed == 4
+
+    def test_batch_does_not_defer_other_changes(self, temp_project):
+        """Test qu'un changement hors compteur écrit tout l'état immédiatement."""
+        project_path, feature_name = temp_project
+        manager = StateManager(project_path, feature_name)
+
+        with manager.batch():
+            manager.update_tasks(5, 10)
+            manager.set_failed("boom")
+            persisted = StateManager(project_path, feature_name).state
+            assert persisted.phase == Phase.FAILED
+            assert persisted.tasks_completed == 5
+
     def test_checkpoint_fields_in_from_dict(self):
         """Test de la désérialisation des champs de checkpoint."""
         data = {